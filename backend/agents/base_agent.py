@@ -4,7 +4,7 @@ import asyncio
 import time
 from datetime import datetime
 
-from models.travel_models import AgentResponse, TravelRequest
+from models.travel_models import AgentResponse, TravelRequest, trip_duration_days
 from services.config import Settings
 
 class BaseAgent(ABC):
@@ -20,6 +20,10 @@ class BaseAgent(ABC):
         self.initialized = True
         print(f"✅ {self.name} initialized")
     
+    async def shutdown(self):
+        """Release any resources held by the agent"""
+        pass
+    
     @abstractmethod
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -110,9 +114,4 @@ class BaseAgent(ABC):
     
     def calculate_trip_duration(self, start_date: str, return_date: str) -> int:
         """Calculate trip duration in days"""
-        try:
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(return_date, '%Y-%m-%d')
-            return (end - start).days
-        except:
-            return 0
\ No newline at end of file
+        return trip_duration_days(start_date, return_date)
@@ -31,6 +31,11 @@ class CostEstimationAgent(BaseAgent):
         self.miscellaneous_cost_estimator = MiscellaneousCostEstimator(self.grok_service)
         print("✅ All cost estimators initialized (Food, Activities, Miscellaneous)")
     
+    async def shutdown(self):
+        """Close the Grok service's HTTP client"""
+        if self.grok_service:
+            await self.grok_service.aclose()
+    
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Estimate comprehensive travel costs"""
         try:
@@ -71,7 +76,7 @@ class CostEstimationAgent(BaseAgent):
     
     async def _calculate_cost_breakdown(self, request: TravelRequest, agent_data: Dict[str, Any]) -> CostBreakdown:
         """Calculate detailed cost breakdown"""
-        trip_duration = self.calculate_trip_duration(request.start_date, request.return_date)
+        trip_duration = request.trip_duration
         
         # Flight costs - use the cheapest flight
         flights_cost = 0
@@ -128,8 +133,11 @@ class CostEstimationAgent(BaseAgent):
         try:
             from services.serp_service import SerpService
             serp = SerpService(self.settings)
-            await serp.initialize()
-            activities_list = await serp.search_activities(destination=request.destination, vibe=request.vibe.value)
+            try:
+                await serp.initialize()
+                activities_list = await serp.search_activities(destination=request.destination, vibe=request.vibe.value)
+            finally:
+                await serp.aclose()
         except Exception as e:
             print(f"   ⚠️ Could not fetch activities from SERP: {e}")
         
@@ -19,6 +19,11 @@ class EmotionalIntelligenceAgent(BaseAgent):
         self.grok_service = GrokService(self.settings)
         await self.grok_service.initialize()
     
+    async def shutdown(self):
+        """Close the Grok service's HTTP client"""
+        if self.grok_service:
+            await self.grok_service.aclose()
+    
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Analyze emotional intelligence and vibe compatibility"""
         try:
@@ -87,7 +92,7 @@ class EmotionalIntelligenceAgent(BaseAgent):
         Vibe: {request.vibe.value}
         Season: {self.get_season_from_date(request.start_date)}
         Travelers: {request.travelers}
-        Duration: {self.calculate_trip_duration(request.start_date, request.return_date)} days
+        Duration: {request.trip_duration} days
         
         Please provide:
         1. 3-5 specific activities that match the {request.vibe.value} vibe
@@ -12,18 +12,24 @@ from services.price_calendar import PriceCalendar
 class FlightSearchAgent(BaseAgent):
     """Agent responsible for finding and analyzing flight options"""
     
-    def __init__(self, settings):
+    def __init__(self, settings, http_client: httpx.AsyncClient = None):
         super().__init__("Flight Search Agent", settings)
+        self.http_client = http_client
         self.serp_service = None
         self.price_calendar = None
     
     async def initialize(self):
         """Initialize the flight search agent"""
         await super().initialize()
-        self.serp_service = SerpService(self.settings)
+        self.serp_service = SerpService(self.settings, self.http_client)
         await self.serp_service.initialize()
         self.price_calendar = PriceCalendar(self.serp_service)
     
+    async def shutdown(self):
+        """Close the SERP service's HTTP client"""
+        if self.serp_service:
+            await self.serp_service.aclose()
+    
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Search for flight options with optional price trend analysis"""
         try:
@@ -1,4 +1,5 @@
 import asyncio
+import httpx
 from typing import Dict, Any, List
 import json
 
@@ -10,19 +11,27 @@ from services.grok_service import GrokService
 class HotelSearchAgent(BaseAgent):
     """Agent responsible for finding and analyzing hotel options"""
     
-    def __init__(self, settings):
+    def __init__(self, settings, http_client: httpx.AsyncClient = None):
         super().__init__("Hotel Search Agent", settings)
+        self.http_client = http_client
         self.serp_service = None
         self.grok_service = None
     
     async def initialize(self):
         """Initialize the hotel search agent"""
         await super().initialize()
-        self.serp_service = SerpService(self.settings)
+        self.serp_service = SerpService(self.settings, self.http_client)
         await self.serp_service.initialize()
         self.grok_service = GrokService(self.settings)
         await self.grok_service.initialize()
     
+    async def shutdown(self):
+        """Close the SERP and Grok services' HTTP clients"""
+        if self.serp_service:
+            await self.serp_service.aclose()
+        if self.grok_service:
+            await self.grok_service.aclose()
+    
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Search for hotel options that match the vibe"""
         try:
@@ -20,6 +20,11 @@ class RecommendationAgent(BaseAgent):
         self.grok_service = GrokService(self.settings)
         await self.grok_service.initialize()
     
+    async def shutdown(self):
+        """Close the Grok service's HTTP client"""
+        if self.grok_service:
+            await self.grok_service.aclose()
+    
     async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Create personalized itinerary and recommendations"""
         try:
@@ -57,7 +62,7 @@ class RecommendationAgent(BaseAgent):
         Travelers: {request.travelers}
         Start Date: {request.start_date}
         Return Date: {request.return_date}
-        Duration: {self.calculate_trip_duration(request.start_date, request.return_date)} days
+        Duration: {request.trip_duration} days
         
         For each day, provide 4-6 activities with:
         - name
@@ -192,7 +197,7 @@ class RecommendationAgent(BaseAgent):
             Destination: {request.destination}
             Vibe: {request.vibe.value}
             Travelers: {request.travelers}
-            Duration: {self.calculate_trip_duration(request.start_date, request.return_date)} days
+            Duration: {request.trip_duration} days
             Season: {self.get_season_from_date(request.start_date)}
             
             Provide 5-7 specific, actionable recommendations that enhance the {request.vibe.value} experience.
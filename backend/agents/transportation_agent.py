@@ -1,6 +1,15 @@
 import asyncio
-from typing import Dict, Any, List
+import json
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
 import googlemaps
+import httpx
 from datetime import datetime
 
 from .base_agent import BaseAgent
@@ -10,6 +19,231 @@ from services.intelligent_pricing_service import IntelligentPricingService
 from services.airport_resolver import AirportResolver
 from services.grok_service import GrokService
 from .local_transport_estimator import LocalTransportEstimator
+from utils.caching import SingleFlight, TTLCache
+from utils.rate_limiter import AsyncTokenBucket
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
+
+DISTANCE_MATRIX_URL = "https://maps.googleapis.com/maps/api/distancematrix/json"
+DISTANCE_MATRIX_CACHE_TTL = 24 * 3600  # seconds
+DISTANCE_MATRIX_CACHE_SIZE = 4096
+DISTANCE_MATRIX_FAILURE_BACKOFF = 60  # seconds to skip a query after it fails
+DISTANCE_MATRIX_RATE = 50  # requests per second, below Google's per-second quota
+DISTANCE_MATRIX_MAX_ATTEMPTS = 4
+LLM_PRICE_CACHE_TTL = 24 * 3600  # seconds
+LLM_PRICE_CACHE_SIZE = 1024
+COUNTRY_CACHE_SIZE = 5000  # detected countries per agent, least recently used evicted first
+
+# Failures a Maps lookup can raise: transport/HTTP errors, a non-OK API status
+# (RuntimeError), malformed JSON (ValueError) or an unexpected response shape
+_MAPS_ERRORS = (httpx.HTTPError, RuntimeError, ValueError, KeyError, IndexError)
+
+logger = logging.getLogger(__name__)
+
+# googlemaps clients shared across agent instances, keyed by API key, so their
+# underlying requests session (and connection pool) is reused
+_GMAPS_CLIENTS: Dict[str, googlemaps.Client] = {}
+
+
+def _shared_gmaps_client(api_key: str) -> googlemaps.Client:
+    client = _GMAPS_CLIENTS.get(api_key)
+    if client is None:
+        client = _GMAPS_CLIENTS[api_key] = googlemaps.Client(key=api_key, timeout=8)
+    return client
+
+
+@dataclass(slots=True, frozen=True)
+class AirportTransferOption:
+    type: str
+    cost_per_trip: float
+    duration_minutes: float
+    description: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class LocalTransportOption:
+    type: str
+    cost_per_day: float
+    description: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class InterCityOption:
+    type: str
+    cost_per_trip: float
+    duration_hours: float
+    duration_str: str
+    distance_km: float = 0.0
+    description: str = ""
+    quality: Optional[str] = None
+    booking: Optional[str] = None
+    notes: Optional[str] = None
+    ai_confidence: Optional[float] = None
+    
+    def to_ui_dict(self) -> Dict[str, Any]:
+        """Flatten for the UI, which reads cost and duration under both their old and new keys"""
+        # Format duration if not already provided (producers normally set duration_str)
+        duration = self.duration_str or (_format_hm(self.duration_hours) if self.duration_hours > 0 else "Varies")
+        return {
+            "type": self.type,
+            "cost": self.cost_per_trip,
+            "cost_per_trip": self.cost_per_trip,
+            "duration": duration,
+            "duration_str": duration,
+            "duration_hours": self.duration_hours,
+            "distance_km": self.distance_km,
+            "description": self.description,
+            "quality": self.quality or "",
+            "booking": self.booking or "",
+            "notes": self.notes,
+            "ai_confidence": self.ai_confidence or 0
+        }
+
+
+def _drop_unset(fields) -> Dict[str, Any]:
+    return {key: value for key, value in fields if value is not None}
+
+
+def options_to_dicts(options) -> List[Dict[str, Any]]:
+    """Convert option records to plain dicts for the API response, omitting unset fields"""
+    return [asdict(option, dict_factory=_drop_unset) for option in options]
+
+
+class TransportOptions(NamedTuple):
+    """Transportation options for a trip, grouped by category"""
+    airport_transfer: Sequence[AirportTransferOption]
+    local_transportation: Sequence[LocalTransportOption]
+    inter_city_transportation: Sequence[InterCityOption]
+
+# Well-known attractions per city, matched as a whole word in the destination
+_ATTRACTIONS_BY_CITY = {
+    "tokyo": (
+        {"name": "Senso-ji Temple", "location": "Asakusa, Tokyo"},
+        {"name": "Tokyo Skytree", "location": "Sumida, Tokyo"},
+        {"name": "Shibuya Crossing", "location": "Shibuya, Tokyo"},
+        {"name": "Tsukiji Fish Market", "location": "Chuo, Tokyo"}
+    ),
+    "paris": (
+        {"name": "Eiffel Tower", "location": "7th arrondissement, Paris"},
+        {"name": "Louvre Museum", "location": "1st arrondissement, Paris"},
+        {"name": "Notre-Dame Cathedral", "location": "4th arrondissement, Paris"},
+        {"name": "Champs-Élysées", "location": "8th arrondissement, Paris"}
+    ),
+    "new york": (
+        {"name": "Times Square", "location": "Manhattan, New York"},
+        {"name": "Central Park", "location": "Manhattan, New York"},
+        {"name": "Statue of Liberty", "location": "Liberty Island, New York"},
+        {"name": "Brooklyn Bridge", "location": "Brooklyn, New York"}
+    )
+}
+# How each LLM price entry maps to an option: (price key, option type, default duration,
+# default quality, default booking, description template)
+_LLM_PRICE_SPEC = (
+    ("train", "train", "1h", "standard", "station or online", "Train service covering {distance_km:.0f} km"),
+    ("bus", "bus", "1h 20m", "basic", "bus terminal", "Inter-city bus covering {distance_km:.0f} km"),
+    ("car_rental", "car_rental", "1h", "good", "rental agency", "Self-drive car rental ({distance_km:.0f} km)"),
+    ("taxi", "private_car", "1h", "comfortable", "hotel or app", "Private car/taxi service ({distance_km:.0f} km)"),
+)
+
+# LLM durations such as "2h 30m", "45m", "1 hour 15 min" or "about 2 hours"; leading words are skipped
+_DURATION_RE = re.compile(r"\D*(?:(\d+(?:\.\d+)?)\s*h[a-z]*)?\s*(?:(\d+)\s*m)?", re.IGNORECASE)
+
+_CITIES = tuple(_ATTRACTIONS_BY_CITY)
+# One capture group per city, in _CITIES order; spaces in names match any whitespace (or none)
+_CITY_RE = re.compile(r"\b(?:" + "|".join(
+    "(" + r"\s*".join(map(re.escape, city.split())) + ")" for city in _CITIES
+) + r")\b")
+
+# Static option lists used when Google Maps is unavailable. Callers only read
+# these, so methods return the shared tuples rather than copies.
+_MOCK_AIRPORT_TRANSFER_OPTIONS = (
+    AirportTransferOption("taxi", 35, 25, "Airport taxi service"),
+    AirportTransferOption("uber", 28, 25, "Ride-sharing service"),
+    AirportTransferOption("shuttle", 18, 35, "Airport shuttle bus")
+)
+
+# Sorted by cost_per_day, cheapest first
+_LOCAL_TRANSPORTATION_OPTIONS = (
+    LocalTransportOption("public_transport", 12, "Unlimited public transport pass"),
+    LocalTransportOption("bike_rental", 15, "Bicycle rental"),
+    LocalTransportOption("uber", 40, "Ride-sharing for local travel"),
+    LocalTransportOption("car_rental", 45, "Car rental with insurance"),
+    LocalTransportOption("taxi", 50, "Taxi for local travel")
+)
+
+_ZERO_COST_BREAKDOWN = {
+    "airport_transfer": 0,
+    "local_transportation": 0,
+    "inter_city_transportation": 0,
+    "total": 0,
+    "cost_per_person": 0
+}
+
+_MOCK_ROUTE_OPTIMIZATION = {
+    "optimized_routes": (
+        {
+            "from": "Hotel",
+            "to": "City Center",
+            "distance_km": 5.2,
+            "duration_minutes": 15
+        },
+        {
+            "from": "City Center",
+            "to": "Museum District",
+            "distance_km": 2.8,
+            "duration_minutes": 8
+        },
+        {
+            "from": "Museum District",
+            "to": "Restaurant Area",
+            "distance_km": 1.5,
+            "duration_minutes": 5
+        }
+    ),
+    "total_distance_km": 9.5,
+    "total_duration_minutes": 28
+}
+
+# Fallback inter-city fares in USD (USA pricing) as (base, per_km, floor, ceiling),
+# ordered train, bus, car rental, private car
+_FALLBACK_FARE_COEFFS = (
+    (15, 0.15, 20, 100),
+    (10, 0.10, 10, 60),
+    (25, 0.20, 30, 150),
+    (35, 0.50, 40, 300),
+)
+
+# Fallback options in the same order as the fares: (type, multiple of driving time, description template)
+_FALLBACK_OPTION_SPEC = (
+    ("train", 1.1, "Train service covering {distance_km:.0f} km"),
+    ("bus", 1.2, "Inter-city bus covering {distance_km:.0f} km"),
+    ("car_rental", 1.0, "Self-drive car rental ({distance_km:.0f} km)"),
+    ("private_car", 1.0, "Private car/taxi service ({distance_km:.0f} km)"),
+)
+
+
+def _format_hm(hours: float) -> str:
+    """Format a duration in hours like 2h 30m, 2h or 45m"""
+    h, m = divmod(round(hours * 60), 60)
+    if h > 0 and m > 0:
+        return f"{h}h {m}m"
+    elif h > 0:
+        return f"{h}h"
+    else:
+        return f"{m}m"
+
+
+def fallback_base_fares(distance_km: float) -> Tuple[float, float, float, float]:
+    """USA-priced fallback fares (train, bus, car rental, private car) for a distance"""
+    return tuple(
+        max(floor, min(ceiling, base + distance_km * per_km))
+        for base, per_km, floor, ceiling in _FALLBACK_FARE_COEFFS
+    )
+
 
 class TransportationAgent(BaseAgent):
     """Agent responsible for transportation planning and cost estimation"""
@@ -17,33 +251,55 @@ class TransportationAgent(BaseAgent):
     def __init__(self, settings: Settings):
         super().__init__("Transportation Agent", settings)
         self.gmaps_client = None
+        self._http = None
+        self._distance_cache = TTLCache(DISTANCE_MATRIX_CACHE_SIZE, DISTANCE_MATRIX_CACHE_TTL)
+        self._distance_inflight = SingleFlight()
+        self._distance_failures: Dict[tuple, float] = {}
+        self._rate_limiter = None
+        self.maps_throttled_count = 0
         self.pricing_service = None
         self.airport_resolver = None
+        self._country_cache = TTLCache(COUNTRY_CACHE_SIZE)
         self.llm_pricing_agent = None
+        self._llm_pricing_agent_loaded = False
+        self._llm_price_cache = TTLCache(LLM_PRICE_CACHE_SIZE, LLM_PRICE_CACHE_TTL)
+        self._llm_price_inflight = SingleFlight()
         self.grok_service = None
         self.local_transport_estimator = None
+        self._bind_maps_methods(live=False)
+    
+    def _bind_maps_methods(self, live: bool):
+        """Pick the Google Maps or mock implementations once, instead of checking on every request"""
+        if live:
+            self._get_airport_transfer_options = self._get_live_airport_transfer_options
+            self._optimize_routes = self._optimize_live_routes
+        else:
+            self._get_airport_transfer_options = self._get_mock_airport_transfer_options_async
+            self._optimize_routes = self._get_mock_route_optimization_async
     
     async def initialize(self):
         """Initialize the transportation agent"""
         await super().initialize()
         
         if self.settings.google_maps_api_key:
-            self.gmaps_client = googlemaps.Client(key=self.settings.google_maps_api_key)
+            # Sync client is kept for DistanceCalculator; this agent's own Maps calls
+            # go through a persistent async HTTP/2 client so they don't block the loop
+            self.gmaps_client = _shared_gmaps_client(self.settings.google_maps_api_key)
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(8.0, connect=2.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+            )
+            self._rate_limiter = AsyncTokenBucket(rate=DISTANCE_MATRIX_RATE, capacity=DISTANCE_MATRIX_RATE)
+            self._bind_maps_methods(live=True)
         else:
-            print("⚠️ Google Maps API key not provided, using mock data")
+            logger.warning("Google Maps API key not provided, using mock transfer and route data")
         
         # Initialize Grok service for LLM pricing
         self.grok_service = GrokService(self.settings)
         await self.grok_service.initialize()
         
-        # Initialize LLM pricing agent (preferred method)
-        try:
-            from .transportation_pricing_agent import TransportationPricingAgent
-            self.llm_pricing_agent = TransportationPricingAgent(self.grok_service)
-            print("✅ LLM Pricing Agent initialized")
-        except Exception as e:
-            print(f"⚠️ Could not initialize LLM pricing agent: {e}")
-            self.llm_pricing_agent = None
+        # The LLM pricing agent (preferred method) is built on first use, see _get_llm_pricing_agent
         
         # Fallback: Initialize simple intelligent pricing service
         self.pricing_service = IntelligentPricingService(self.grok_service)
@@ -52,105 +308,174 @@ class TransportationAgent(BaseAgent):
         # Initialize local transport estimator
         self.local_transport_estimator = LocalTransportEstimator(self.grok_service)
     
-    async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Plan transportation and calculate costs"""
+    def _get_llm_pricing_agent(self):
+        """
+        Build the LLM pricing agent on first use, keeping its import off the startup
+        path. Construction never awaits, so concurrent first requests can't build it twice.
+        """
+        if not self._llm_pricing_agent_loaded:
+            self._llm_pricing_agent_loaded = True
+            try:
+                from .transportation_pricing_agent import TransportationPricingAgent
+                self.llm_pricing_agent = TransportationPricingAgent(self.grok_service)
+                logger.info("LLM pricing agent initialized")
+            except Exception as e:
+                logger.warning("Could not initialize LLM pricing agent: %s", e)
+                self.llm_pricing_agent = None
+        return self.llm_pricing_agent
+    
+    async def shutdown(self):
+        """Close the persistent Google Maps and Grok HTTP clients"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+            self._bind_maps_methods(live=False)
+        if self.grok_service:
+            await self.grok_service.aclose()
+    
+    async def _distance_matrix(self, origins: List[str], destinations: List[str], mode: str = "driving", units: str = "metric") -> Dict[str, Any]:
+        """
+        Query the Google Distance Matrix API, served from a TTL'd LRU cache.
+        Concurrent misses for the same query share a single upstream request.
+        """
+        key = (tuple(origins), tuple(destinations), mode, units)
+        
+        cached = self._distance_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        failed_at = self._distance_failures.get(key)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < DISTANCE_MATRIX_FAILURE_BACKOFF:
+                raise RuntimeError("Distance Matrix query failed recently; skipping")
+            del self._distance_failures[key]
+        
         try:
-            self.validate_request(request)
-            
-            # Check if this is domestic travel (no flights)
-            has_flights = False
-            if context and context.get("flight_search_agent"):
-                flights = context["flight_search_agent"].get("data", {}).get("flights", [])
-                has_flights = len(flights) > 0
-            
-            # Get transportation options
-            transportation_options = await self._get_transportation_options(request, context)
-            
-            # Calculate costs (pass has_flights to exclude airport transfers for domestic)
-            cost_breakdown = await self._calculate_transportation_costs(transportation_options, request, has_flights)
-            
-            # Get route optimization
-            route_optimization = await self._optimize_routes(request, context)
-            
-            # Format inter-city options for UI display
-            inter_city_options = []
-            if transportation_options.get("inter_city_transportation"):
-                for option in transportation_options["inter_city_transportation"]:
-                    # Format duration if not already provided
-                    duration_str = option.get("duration_str")
-                    if not duration_str and "duration_hours" in option and option["duration_hours"] > 0:
-                        hours = int(option["duration_hours"])
-                        minutes = int((option["duration_hours"] - hours) * 60)
-                        duration_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-                    elif not duration_str:
-                        duration_str = "Varies"
-                    
-                    # Pass through ALL fields from the original option
-                    formatted_option = {
-                        "type": option.get("type"),
-                        "cost": option.get("cost_per_trip", option.get("cost", 0)),
-                        "cost_per_trip": option.get("cost_per_trip", option.get("cost", 0)),
-                        "duration": duration_str,
-                        "duration_str": duration_str,
-                        "duration_hours": option.get("duration_hours", 0),
-                        "distance_km": option.get("distance_km", 0),
-                        "description": option.get("description", ""),
-                        "quality": option.get("quality", ""),
-                        "booking": option.get("booking", ""),
-                        "notes": option.get("notes"),
-                        "ai_confidence": option.get("ai_confidence", 0)
-                    }
-                    inter_city_options.append(formatted_option)
-            
-            # Format local transportation for UI
-            local_transportation = {}
-            if transportation_options.get("local_transportation"):
-                local_options = [opt["type"] for opt in transportation_options["local_transportation"]]
-                daily_cost = transportation_options["local_transportation"][0].get("cost_per_day", 0) if transportation_options["local_transportation"] else 0
-                local_transportation = {
-                    "options": local_options,
-                    "daily_cost": daily_cost
-                }
+            result = await self._distance_inflight.run(
+                key, lambda: self._fetch_distance_matrix(origins, destinations, mode, units)
+            )
+        except _MAPS_ERRORS:
+            self._distance_failures[key] = time.monotonic()
+            raise
+        
+        self._distance_cache.set(key, result)
+        return result
+    
+    async def _fetch_distance_matrix(self, origins: List[str], destinations: List[str], mode: str, units: str) -> Dict[str, Any]:
+        """
+        Query the Google Distance Matrix API over the shared async client.
+        Requests are rate limited, and quota rejections are retried with exponential backoff.
+        """
+        params = {
+            "origins": "|".join(origins),
+            "destinations": "|".join(destinations),
+            "mode": mode,
+            "units": units,
+            "key": self.settings.google_maps_api_key
+        }
+        
+        for attempt in range(DISTANCE_MATRIX_MAX_ATTEMPTS):
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            response = await self._http.get(DISTANCE_MATRIX_URL, params=params)
             
-            return {
-                "transportation_options": transportation_options,
-                "inter_city_options": inter_city_options,  # Formatted for UI
-                "inter_city_transportation": inter_city_options,  # Also provide as inter_city_transportation for compatibility
-                "local_transportation": local_transportation,  # Formatted for UI
-                "costs": cost_breakdown,  # Also provide as "costs" for UI
-                "cost_breakdown": cost_breakdown,
-                "route_optimization": route_optimization,
-                "total_transportation_cost": cost_breakdown.get("total", 0)
-            }
+            throttled = response.status_code == 429
+            if not response.is_error:
+                result = _json_loads(response.content)
+                throttled = result.get("status") == "OVER_QUERY_LIMIT"
             
-        except Exception as e:
-            return {"error": str(e)}
+            if not throttled or attempt == DISTANCE_MATRIX_MAX_ATTEMPTS - 1:
+                break
+            self.maps_throttled_count += 1
+            await asyncio.sleep(0.2 * 2 ** attempt + random.random() * 0.1)
+        
+        if response.is_error:
+            # Don't use raise_for_status(): its message embeds the URL, API key included
+            raise RuntimeError(f"Distance Matrix HTTP error: {response.status_code}")
+        if result.get("status") != "OK":
+            raise RuntimeError(f"Distance Matrix API error: {result.get('status')}")
+        return result
     
-    async def _get_transportation_options(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        options = {
-            "airport_transfer": await self._get_airport_transfer_options(request),
-            "local_transportation": await self._get_local_transportation_options(request),
-            "inter_city_transportation": await self._get_inter_city_transportation_options(request)
-        }
+    async def process(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Plan transportation and calculate costs"""
+        self.validate_request(request)
+        
+        # Check if this is domestic travel (no flights)
+        has_flights = False
+        if context and context.get("flight_search_agent"):
+            flights = context["flight_search_agent"].get("data", {}).get("flights", [])
+            has_flights = len(flights) > 0
+        
+        # Get transportation options (airport transfers are skipped for domestic trips)
+        # and route optimization concurrently; they share no state. The destination's
+        # country is resolved alongside so the local cost estimate finds it cached.
+        transportation_options, route_optimization, _ = await asyncio.gather(
+            self._get_transportation_options(request, context, has_flights),
+            self._optimize_routes(request, context),
+            self._detect_country(request.destination)
+        )
+        
+        # Calculate costs (pass has_flights to exclude airport transfers for domestic)
+        cost_breakdown = await self._calculate_transportation_costs(transportation_options, request, has_flights)
+        
+        # Format inter-city options for UI display
+        inter_city_options = [
+            option.to_ui_dict()
+            for option in transportation_options.inter_city_transportation
+        ]
         
-        return options
+        # Format local transportation for UI
+        local_transportation = {}
+        local_options = transportation_options.local_transportation
+        if local_options:
+            local_transportation = {
+                "options": [opt.type for opt in local_options],
+                "daily_cost": local_options[0].cost_per_day  # cheapest option
+            }
+        
+        return {
+            "transportation_options": {
+                category: options_to_dicts(options)
+                for category, options in transportation_options._asdict().items()
+            },
+            "inter_city_options": inter_city_options,  # Formatted for UI
+            "local_transportation": local_transportation,  # Formatted for UI
+            "cost_breakdown": cost_breakdown,
+            "route_optimization": route_optimization,
+            "total_transportation_cost": cost_breakdown.get("total", 0)
+        }
     
-    async def _get_airport_transfer_options(self, request: TravelRequest) -> List[Dict[str, Any]]:
-        if not self.gmaps_client:
-            return self._get_mock_airport_transfer_options(request)
+    async def _get_transportation_options(self, request: TravelRequest, context: Dict[str, Any] = None, has_flights: bool = True) -> TransportOptions:
+        inter_city = self._get_inter_city_transportation_options(request)
+        if has_flights:
+            airport_transfer, inter_city_options = await asyncio.gather(
+                self._get_airport_transfer_options(request),
+                inter_city,
+                return_exceptions=True
+            )
+            # Airport transfers are best-effort: fall back to typical prices rather than failing the trip
+            if isinstance(airport_transfer, Exception):
+                logger.warning("Airport transfer options failed for %s: %s", request.destination, airport_transfer)
+                airport_transfer = self._get_mock_airport_transfer_options(request)
+            if isinstance(inter_city_options, Exception):
+                raise inter_city_options
+        else:
+            airport_transfer, inter_city_options = [], await inter_city
         
+        return TransportOptions(
+            airport_transfer=airport_transfer,
+            local_transportation=self._get_local_transportation_options(request),
+            inter_city_transportation=inter_city_options
+        )
+    
+    async def _get_live_airport_transfer_options(self, request: TravelRequest) -> Sequence[AirportTransferOption]:
         try:
             # Get airport to hotel distance and time
             origin = f"{request.destination} Airport"
             destination = "Downtown " + request.destination
             
             # Get distance matrix
-            result = self.gmaps_client.distance_matrix(
-                origins=[origin],
-                destinations=[destination],
-                mode="driving",
-                units="metric"
-            )
+            result = await self._distance_matrix([origin], [destination])
             
             if result['rows'][0]['elements'][0]['status'] == 'OK':
                 element = result['rows'][0]['elements'][0]
@@ -158,222 +483,138 @@ class TransportationAgent(BaseAgent):
                 duration = element['duration']['value'] / 60  # Convert to minutes
                 
                 return [
-                    {
-                        "type": "taxi",
-                        "cost_per_trip": 25 + (distance * 2),
-                        "duration_minutes": duration,
-                        "description": "Airport taxi service"
-                    },
-                    {
-                        "type": "uber",
-                        "cost_per_trip": 20 + (distance * 1.5),
-                        "duration_minutes": duration,
-                        "description": "Ride-sharing service"
-                    },
-                    {
-                        "type": "shuttle",
-                        "cost_per_trip": 15,
-                        "duration_minutes": duration + 10,
-                        "description": "Airport shuttle bus"
-                    }
+                    AirportTransferOption("taxi", 25 + (distance * 2), duration, "Airport taxi service"),
+                    AirportTransferOption("uber", 20 + (distance * 1.5), duration, "Ride-sharing service"),
+                    AirportTransferOption("shuttle", 15, duration + 10, "Airport shuttle bus")
                 ]
-        except Exception as e:
-            print(f"Error getting airport transfer options: {e}")
+        except _MAPS_ERRORS as e:
+            logger.warning("Airport transfer lookup failed for %s: %s", request.destination, e)
         
         return self._get_mock_airport_transfer_options(request)
     
-    def _get_mock_airport_transfer_options(self, request: TravelRequest) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "taxi",
-                "cost_per_trip": 35,
-                "duration_minutes": 25,
-                "description": "Airport taxi service"
-            },
-            {
-                "type": "uber",
-                "cost_per_trip": 28,
-                "duration_minutes": 25,
-                "description": "Ride-sharing service"
-            },
-            {
-                "type": "shuttle",
-                "cost_per_trip": 18,
-                "duration_minutes": 35,
-                "description": "Airport shuttle bus"
-            }
-        ]
+    def _get_mock_airport_transfer_options(self, request: TravelRequest) -> Sequence[AirportTransferOption]:
+        return _MOCK_AIRPORT_TRANSFER_OPTIONS
     
-    async def _get_local_transportation_options(self, request: TravelRequest) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "public_transport",
-                "cost_per_day": 12,
-                "description": "Unlimited public transport pass"
-            },
-            {
-                "type": "taxi",
-                "cost_per_day": 50,
-                "description": "Taxi for local travel"
-            },
-            {
-                "type": "uber",
-                "cost_per_day": 40,
-                "description": "Ride-sharing for local travel"
-            },
-            {
-                "type": "car_rental",
-                "cost_per_day": 45,
-                "description": "Car rental with insurance"
-            },
-            {
-                "type": "bike_rental",
-                "cost_per_day": 15,
-                "description": "Bicycle rental"
-            }
-        ]
+    async def _get_mock_airport_transfer_options_async(self, request: TravelRequest) -> Sequence[AirportTransferOption]:
+        return _MOCK_AIRPORT_TRANSFER_OPTIONS
+    
+    def _get_local_transportation_options(self, request: TravelRequest) -> Sequence[LocalTransportOption]:
+        return _LOCAL_TRANSPORTATION_OPTIONS
     
-    async def _get_inter_city_transportation_options(self, request: TravelRequest) -> List[Dict[str, Any]]:
+    async def _get_inter_city_transportation_options(self, request: TravelRequest) -> List[InterCityOption]:
         """
         Get inter-city transportation options.
         For domestic travel, provide comprehensive ground transport options.
         Uses LLM-powered intelligent pricing for maximum accuracy.
+        Options are returned sorted by cost_per_trip, cheapest first.
         """
         # Get distance first
         distance_km = 50  # Default fallback
         duration_hours = 1.0
         
         try:
-            if self.gmaps_client:
-                result = self.gmaps_client.distance_matrix(
-                    origins=[request.origin],
-                    destinations=[request.destination],
-                    mode="driving",
-                    units="metric"
-                )
+            if self._http:
+                result = await self._distance_matrix([request.origin], [request.destination])
                 
                 if result['rows'][0]['elements'][0]['status'] == 'OK':
                     element = result['rows'][0]['elements'][0]
                     distance_km = element['distance']['value'] / 1000
                     duration_hours = element['duration']['value'] / 3600
-        except Exception as e:
-            print(f"Could not get distance from Google Maps: {e}")
+        except _MAPS_ERRORS as e:
+            logger.warning("Distance lookup failed for %s -> %s: %s", request.origin, request.destination, e)
         
         # Try LLM pricing agent first (most intelligent)
-        if self.llm_pricing_agent:
-            try:
-                pricing_result = await self.llm_pricing_agent.calculate_prices(
-                    origin=request.origin,
-                    destination=request.destination,
-                    distance_km=distance_km,
-                    travelers=request.travelers
-                )
-                
-                print(f"🔍 LLM Pricing Result: {pricing_result.keys() if pricing_result else 'None'}")
-                
-                if pricing_result.get("prices"):
-                    formatted_prices = self._format_llm_prices(pricing_result, distance_km)
-                    print(f"🔍 Formatted Prices Count: {len(formatted_prices)}")
-                    if formatted_prices:
-                        print(f"🔍 First Option: {formatted_prices[0].get('type')} - ${formatted_prices[0].get('cost_per_trip')}")
-                    return formatted_prices
-                else:
-                    print(f"⚠️ No prices in LLM result")
-            except Exception as e:
-                print(f"⚠️ LLM pricing failed, falling back: {e}")
-                import traceback
-                traceback.print_exc()
+        llm_pricing_agent = self._get_llm_pricing_agent()
+        if llm_pricing_agent:
+            formatted_prices = await self._get_cached_llm_prices(llm_pricing_agent, request, distance_km)
+            if formatted_prices is not None:
+                return list(formatted_prices)
         
         # Fallback to multiplier-based pricing
-        return await self._get_fallback_pricing(request, distance_km, duration_hours)
+        options = await self._get_fallback_pricing(request, distance_km, duration_hours)
+        options.sort(key=attrgetter("cost_per_trip"))
+        return options
+    
+    async def _get_cached_llm_prices(self, llm_pricing_agent, request: TravelRequest, distance_km: float) -> Optional[List[InterCityOption]]:
+        """
+        LLM prices for a route, cached per city pair, 10 km distance bucket and party size.
+        Concurrent requests for the same route share one LLM run.
+        """
+        key = (request.origin.lower(), request.destination.lower(), round(distance_km / 10) * 10, request.travelers)
+        
+        cached = self._llm_price_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        formatted_prices = await self._llm_price_inflight.run(
+            key, lambda: self._get_llm_prices(llm_pricing_agent, request, distance_km)
+        )
+        
+        if formatted_prices is not None:
+            self._llm_price_cache.set(key, formatted_prices)
+        return formatted_prices
     
-    def _format_llm_prices(self, pricing_result: Dict[str, Any], distance_km: float) -> List[Dict[str, Any]]:
+    async def _get_llm_prices(self, llm_pricing_agent, request: TravelRequest, distance_km: float) -> Optional[List[InterCityOption]]:
+        """Run the LLM pricing agent; None if it fails or returns no prices"""
+        try:
+            pricing_result = await llm_pricing_agent.calculate_prices(
+                origin=request.origin,
+                destination=request.destination,
+                distance_km=distance_km,
+                travelers=request.travelers
+            )
+            
+            logger.debug("LLM pricing result keys: %s", list(pricing_result) if pricing_result else None)
+            
+            if pricing_result.get("prices"):
+                formatted_prices = self._format_llm_prices(pricing_result, distance_km)
+                logger.debug("Formatted %d LLM price options", len(formatted_prices))
+                if formatted_prices:
+                    formatted_prices.sort(key=attrgetter("cost_per_trip"))
+                    logger.debug("Cheapest option: %s at $%s", formatted_prices[0].type, formatted_prices[0].cost_per_trip)
+                return formatted_prices
+            else:
+                logger.warning("No prices in LLM result for %s -> %s", request.origin, request.destination)
+        except Exception as e:
+            logger.warning("LLM pricing failed, falling back: %s", e)
+            logger.debug("LLM pricing failure details", exc_info=True)
+        return None
+    
+    def _format_llm_prices(self, pricing_result: Dict[str, Any], distance_km: float) -> List[InterCityOption]:
         """Format LLM pricing results into expected structure"""
         prices = pricing_result.get("prices", {})
+        confidence = pricing_result.get("confidence", 0.9)
         
         options = []
-        
-        # Train
-        if "train" in prices:
-            train_data = prices["train"]
-            duration_str = train_data.get("duration", "1h")
-            options.append({
-                "type": "train",
-                "cost_per_trip": round(train_data.get("cost", 0), 2),
-                "duration_hours": self._parse_duration(duration_str),
-                "duration_str": duration_str,  # Keep original string for display
-                "distance_km": distance_km,
-                "description": f"Train service covering {distance_km:.0f} km",
-                "quality": train_data.get("quality", "standard"),
-                "booking": train_data.get("booking", "station or online"),
-                "ai_confidence": pricing_result.get("confidence", 0.9)
-            })
-        
-        # Bus
-        if "bus" in prices:
-            bus_data = prices["bus"]
-            duration_str = bus_data.get("duration", "1h 20m")
-            options.append({
-                "type": "bus",
-                "cost_per_trip": round(bus_data.get("cost", 0), 2),
-                "duration_hours": self._parse_duration(duration_str),
-                "duration_str": duration_str,  # Keep original string for display
-                "distance_km": distance_km,
-                "description": f"Inter-city bus covering {distance_km:.0f} km",
-                "quality": bus_data.get("quality", "basic"),
-                "booking": bus_data.get("booking", "bus terminal"),
-                "ai_confidence": pricing_result.get("confidence", 0.9)
-            })
-        
-        # Car rental
-        if "car_rental" in prices:
-            car_data = prices["car_rental"]
-            duration_str = car_data.get("duration", "1h")
-            options.append({
-                "type": "car_rental",
-                "cost_per_trip": round(car_data.get("cost", 0), 2),
-                "duration_hours": self._parse_duration(duration_str),
-                "duration_str": duration_str,  # Keep original string for display
-                "distance_km": distance_km,
-                "description": f"Self-drive car rental ({distance_km:.0f} km)",
-                "quality": car_data.get("quality", "good"),
-                "booking": car_data.get("booking", "rental agency"),
-                "ai_confidence": pricing_result.get("confidence", 0.9)
-            })
-        
-        # Taxi/private car
-        if "taxi" in prices:
-            taxi_data = prices["taxi"]
-            duration_str = taxi_data.get("duration", "1h")
-            options.append({
-                "type": "private_car",
-                "cost_per_trip": round(taxi_data.get("cost", 0), 2),
-                "duration_hours": self._parse_duration(duration_str),
-                "duration_str": duration_str,  # Keep original string for display
-                "distance_km": distance_km,
-                "description": f"Private car/taxi service ({distance_km:.0f} km)",
-                "quality": taxi_data.get("quality", "comfortable"),
-                "booking": taxi_data.get("booking", "hotel or app"),
-                "ai_confidence": pricing_result.get("confidence", 0.9)
-            })
+        for key, option_type, default_duration, default_quality, default_booking, description in _LLM_PRICE_SPEC:
+            data = prices.get(key)
+            if data is None:
+                continue
+            duration_str = data.get("duration", default_duration)
+            options.append(InterCityOption(
+                type=option_type,
+                cost_per_trip=round(data.get("cost", 0), 2),
+                duration_hours=self._parse_duration(duration_str),
+                duration_str=duration_str,  # Keep original string for display
+                distance_km=distance_km,
+                description=description.format(distance_km=distance_km),
+                quality=data.get("quality", default_quality),
+                booking=data.get("booking", default_booking),
+                ai_confidence=confidence
+            ))
         
         return options
     
     def _parse_duration(self, duration_str: str) -> float:
-        """Parse duration string like '1h 15m' to hours"""
-        try:
-            hours = 0
-            minutes = 0
-            if 'h' in duration_str:
-                hours = int(duration_str.split('h')[0].strip())
-            if 'm' in duration_str:
-                min_part = duration_str.split('h')[-1] if 'h' in duration_str else duration_str
-                minutes = int(min_part.replace('m', '').strip())
-            return round(hours + minutes / 60, 1)
-        except:
+        """Parse duration string like '1h 15m' (or '1 hour 15 min') to hours; anything unparseable, e.g. 'flexible', is 1.0"""
+        if not isinstance(duration_str, str):
             return 1.0
+        hours, minutes = _DURATION_RE.match(duration_str.strip()).groups()
+        if hours is None and minutes is None:
+            return 1.0
+        return round(float(hours or 0) + int(minutes or 0) / 60, 1)
     
-    async def _get_fallback_pricing(self, request: TravelRequest, distance_km: float, duration_hours: float) -> List[Dict[str, Any]]:
+    async def _get_fallback_pricing(self, request: TravelRequest, distance_km: float, duration_hours: float) -> List[InterCityOption]:
         """Fallback pricing using multiplier method"""
         # Get country for pricing multiplier
         country = await self._detect_country(request.origin)
@@ -382,121 +623,60 @@ class TransportationAgent(BaseAgent):
         if country and self.pricing_service:
             try:
                 pricing_multiplier = await self.pricing_service.get_pricing_multiplier(country)
-                print(f"🌍 Fallback: Applying {country} pricing multiplier: {pricing_multiplier:.3f}x")
+                logger.info("Fallback: applying %s pricing multiplier %.3fx", country, pricing_multiplier)
             except Exception as e:
-                print(f"⚠️ Could not get pricing multiplier, using default: {e}")
-        
-        # Calculate base costs (USA pricing)
-        base_train = max(20, min(100, 15 + (distance_km * 0.15)))
-        base_bus = max(10, min(60, 10 + (distance_km * 0.10)))
-        base_car = max(30, min(150, 25 + (distance_km * 0.20)))
-        base_taxi = max(40, min(300, 35 + (distance_km * 0.50)))
-        
-        # Apply country-specific multiplier
-        train_cost = base_train * pricing_multiplier
-        bus_cost = base_bus * pricing_multiplier
-        car_cost = base_car * pricing_multiplier
-        taxi_cost = base_taxi * pricing_multiplier
-        
-        # Helper function to format duration hours to string
-        def format_duration(hours):
-            h = int(hours)
-            m = int((hours - h) * 60)
-            if h > 0 and m > 0:
-                return f"{h}h {m}m"
-            elif h > 0:
-                return f"{h}h"
-            else:
-                return f"{m}m"
-        
-        train_duration = round(duration_hours * 1.1, 1)
-        bus_duration = round(duration_hours * 1.2, 1)
-        car_duration = round(duration_hours, 1)
-        
-        return [
-            {
-                "type": "train",
-                "cost_per_trip": round(train_cost, 2),
-                "duration_hours": train_duration,
-                "duration_str": format_duration(train_duration),
-                "distance_km": round(distance_km, 1),
-                "description": f"Train service covering {distance_km:.0f} km"
-            },
-            {
-                "type": "bus",
-                "cost_per_trip": round(bus_cost, 2),
-                "duration_hours": bus_duration,
-                "duration_str": format_duration(bus_duration),
-                "distance_km": round(distance_km, 1),
-                "description": f"Inter-city bus covering {distance_km:.0f} km"
-            },
-            {
-                "type": "car_rental",
-                "cost_per_trip": round(car_cost, 2),
-                "duration_hours": car_duration,
-                "duration_str": format_duration(car_duration),
-                "distance_km": round(distance_km, 1),
-                "description": f"Self-drive car rental ({distance_km:.0f} km)"
-            },
-            {
-                "type": "private_car",
-                "cost_per_trip": round(taxi_cost, 2),
-                "duration_hours": car_duration,
-                "duration_str": format_duration(car_duration),
-                "distance_km": round(distance_km, 1),
-                "description": f"Private car/taxi service ({distance_km:.0f} km)"
-            }
-        ]
+                logger.warning("Could not get pricing multiplier, using default: %s", e)
+        
+        # Apply the country-specific multiplier to the USA base fares
+        rounded_km = round(distance_km, 1)
+        options = []
+        for (option_type, duration_factor, description), fare in zip(_FALLBACK_OPTION_SPEC, fallback_base_fares(distance_km)):
+            option_duration = round(duration_hours * duration_factor, 1)
+            options.append(InterCityOption(
+                type=option_type,
+                cost_per_trip=round(fare * pricing_multiplier, 2),
+                duration_hours=option_duration,
+                duration_str=_format_hm(option_duration),
+                distance_km=rounded_km,
+                description=description.format(distance_km=distance_km)
+            ))
+        return options
     
-    async def _calculate_transportation_costs(self, options: Dict[str, Any], request: TravelRequest, has_flights: bool = True) -> Dict[str, Any]:
-        trip_duration = self.calculate_trip_duration(request.start_date, request.return_date)
+    async def _calculate_transportation_costs(self, options: TransportOptions, request: TravelRequest, has_flights: bool = True) -> Dict[str, Any]:
+        travelers = request.travelers
+        if travelers <= 0:
+            # Nothing to price (TravelRequest validation normally rules this out)
+            return dict(_ZERO_COST_BREAKDOWN)
+        
+        trip_duration = request.trip_duration
+        airport_options, local_options, inter_city_options = options
         
         # Airport transfers (arrival and departure) - ONLY for international travel with flights
-        airport_transfer_cost = 0
-        if has_flights and options.get("airport_transfer"):
-            taxi_cost = options["airport_transfer"][0]["cost_per_trip"]
-            airport_transfer_cost = taxi_cost * 2 * request.travelers  # Round trip
+        airport_transfer_cost = airport_options[0].cost_per_trip * 2 * travelers if has_flights and airport_options else 0
         
-        # Local transportation - use LLM estimator for intelligent calculation
-        local_transport_cost = 0
+        # Local transportation - use LLM estimator, falling back to a realistic $5 per person per day
+        fallback_local_cost = 5.0 * trip_duration * travelers if local_options else 0
+        local_transport_cost = fallback_local_cost
         if self.local_transport_estimator:
             try:
                 # Detect country for better estimation
-                country = await self._detect_country_for_local(request.destination)
+                country = await self._detect_country(request.destination)
                 
                 # Use LLM to estimate realistic local transport costs
                 local_estimate = await self.local_transport_estimator.estimate_local_transport(
                     destination=request.destination,
                     country=country or "Unknown",
-                    num_travelers=request.travelers,
+                    num_travelers=travelers,
                     trip_duration_days=trip_duration
                 )
                 local_transport_cost = local_estimate.get("total_cost", 0)
-                print(f"   💡 LLM Local Transport: ${local_transport_cost} ({trip_duration} days)")
+                logger.info("LLM local transport: $%s (%s days)", local_transport_cost, trip_duration)
             except Exception as e:
-                print(f"   ⚠️ LLM local transport failed, using fallback: {e}")
-                # Fallback to old method
-                if options.get("local_transportation"):
-                    # More realistic: $4-6 per person per day (not $12!)
-                    daily_per_person = 5.0
-                    local_transport_cost = daily_per_person * trip_duration * request.travelers
-        else:
-            # Fallback if no estimator
-            if options.get("local_transportation"):
-                daily_per_person = 5.0
-                local_transport_cost = daily_per_person * trip_duration * request.travelers
-        
-        # Inter-city transportation - using cheapest option (usually train or bus)
-        inter_city_cost = 0
-        if options.get("inter_city_transportation") and len(options["inter_city_transportation"]) > 0:
-            # Use the cheapest option (first one is usually cheapest after sorting)
-            cheapest_option = min(options["inter_city_transportation"], 
-                                 key=lambda x: x.get("cost_per_trip", float('inf')))
-            cost_per_trip = cheapest_option.get("cost_per_trip", 0)
-            
-            # Round trip cost (going there and coming back)
-            # Note: cost_per_trip already includes all travelers from LLM pricing agent
-            inter_city_cost = cost_per_trip * 2
+                logger.warning("LLM local transport failed, using fallback: %s", e)
+        
+        # Inter-city round trip on the cheapest option (options are sorted cheapest-first).
+        # cost_per_trip already includes all travelers from the LLM pricing agent.
+        inter_city_cost = inter_city_options[0].cost_per_trip * 2 if inter_city_options else 0
         
         total_cost = airport_transfer_cost + local_transport_cost + inter_city_cost
         
@@ -505,121 +685,86 @@ class TransportationAgent(BaseAgent):
             "local_transportation": local_transport_cost,
             "inter_city_transportation": inter_city_cost,
             "total": total_cost,
-            "cost_per_person": total_cost / request.travelers if request.travelers > 0 else 0
+            "cost_per_person": total_cost / travelers
         }
     
-    async def _optimize_routes(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        if not self.gmaps_client:
-            return self._get_mock_route_optimization(request)
-        
+    async def _optimize_live_routes(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
         try:
-            attractions = await self._get_popular_attractions(request.destination)
+            attractions = self._get_popular_attractions(request.destination)
             
             optimized_routes = []
-            for i in range(len(attractions) - 1):
-                origin = attractions[i]["location"]
-                destination = attractions[i + 1]["location"]
-                
-                result = self.gmaps_client.distance_matrix(
-                    origins=[origin],
-                    destinations=[destination],
-                    mode="driving"
-                )
-                
-                if result['rows'][0]['elements'][0]['status'] == 'OK':
-                    element = result['rows'][0]['elements'][0]
+            total_km = 0.0
+            total_min = 0.0
+            
+            # One matrix request for every consecutive pair: origin i pairs with
+            # destination i, so the legs are on the diagonal
+            result = await self._distance_matrix(
+                [attraction["location"] for attraction in attractions[:-1]],
+                [attraction["location"] for attraction in attractions[1:]]
+            )
+            
+            for i, row in enumerate(result['rows']):
+                element = row['elements'][i]
+                if element['status'] == 'OK':
+                    km = element['distance']['value'] / 1000
+                    mn = element['duration']['value'] / 60
+                    total_km += km
+                    total_min += mn
                     optimized_routes.append({
                         "from": attractions[i]["name"],
                         "to": attractions[i + 1]["name"],
-                        "distance_km": element['distance']['value'] / 1000,
-                        "duration_minutes": element['duration']['value'] / 60
+                        "distance_km": km,
+                        "duration_minutes": mn
                     })
             
             return {
                 "optimized_routes": optimized_routes,
-                "total_distance_km": sum(route["distance_km"] for route in optimized_routes),
-                "total_duration_minutes": sum(route["duration_minutes"] for route in optimized_routes)
+                "total_distance_km": total_km,
+                "total_duration_minutes": total_min
             }
             
-        except Exception as e:
-            print(f"Error optimizing routes: {e}")
+        except _MAPS_ERRORS as e:
+            logger.warning("Route optimization failed for %s: %s", request.destination, e)
             return self._get_mock_route_optimization(request)
     
-    async def _detect_country(self, city: str) -> str:
-        """Detect which country a city is in"""
+    async def _detect_country(self, city: str) -> Optional[str]:
+        """Detect which country a city is in (None if unknown); only detected countries are cached"""
+        city_key = city.strip().lower()
+        cached = self._country_cache.get(city_key)
+        if cached is not None:
+            return cached
+        
+        country = None
         try:
             if self.airport_resolver:
                 country = await self.airport_resolver.get_country_for_city(city)
-                if country:
-                    return country
         except Exception as e:
-            print(f"Could not detect country for {city}: {e}")
-        
-        # Fallback - return None if we can't detect
-        return None
-    
-    async def _detect_country_for_local(self, city: str) -> str:
-        """Detect country for local transport estimation (alias of _detect_country)"""
-        return await self._detect_country(city)
+            logger.warning("Could not detect country for %s: %s", city, e)
+            return None
+        
+        # The resolver reports geocoding timeouts and errors as None too, so a miss
+        # is not remembered; the next request for the city looks it up again
+        if not country:
+            return None
+        self._country_cache.set(city_key, country)
+        return country
     
     def _get_mock_route_optimization(self, request: TravelRequest) -> Dict[str, Any]:
-        return {
-            "optimized_routes": [
-                {
-                    "from": "Hotel",
-                    "to": "City Center",
-                    "distance_km": 5.2,
-                    "duration_minutes": 15
-                },
-                {
-                    "from": "City Center",
-                    "to": "Museum District",
-                    "distance_km": 2.8,
-                    "duration_minutes": 8
-                },
-                {
-                    "from": "Museum District",
-                    "to": "Restaurant Area",
-                    "distance_km": 1.5,
-                    "duration_minutes": 5
-                }
-            ],
-            "total_distance_km": 9.5,
-            "total_duration_minutes": 28
-        }
+        return _MOCK_ROUTE_OPTIMIZATION
     
-    async def _get_popular_attractions(self, destination: str) -> List[Dict[str, Any]]:
-        attractions_data = {
-            "tokyo": [
-                {"name": "Senso-ji Temple", "location": "Asakusa, Tokyo"},
-                {"name": "Tokyo Skytree", "location": "Sumida, Tokyo"},
-                {"name": "Shibuya Crossing", "location": "Shibuya, Tokyo"},
-                {"name": "Tsukiji Fish Market", "location": "Chuo, Tokyo"}
-            ],
-            "paris": [
-                {"name": "Eiffel Tower", "location": "7th arrondissement, Paris"},
-                {"name": "Louvre Museum", "location": "1st arrondissement, Paris"},
-                {"name": "Notre-Dame Cathedral", "location": "4th arrondissement, Paris"},
-                {"name": "Champs-Élysées", "location": "8th arrondissement, Paris"}
-            ],
-            "new york": [
-                {"name": "Times Square", "location": "Manhattan, New York"},
-                {"name": "Central Park", "location": "Manhattan, New York"},
-                {"name": "Statue of Liberty", "location": "Liberty Island, New York"},
-                {"name": "Brooklyn Bridge", "location": "Brooklyn, New York"}
-            ]
-        }
-        
-        default_attractions = [
+    async def _get_mock_route_optimization_async(self, request: TravelRequest, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        return _MOCK_ROUTE_OPTIMIZATION
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_popular_attractions(destination: str) -> Sequence[Dict[str, Any]]:
+        """Get attractions for a destination (cached per destination string)"""
+        match = _CITY_RE.search(destination.lower())
+        if match:
+            return _ATTRACTIONS_BY_CITY[_CITIES[match.lastindex - 1]]
+        return (
             {"name": "City Center", "location": f"Downtown {destination}"},
             {"name": "Museum District", "location": f"Museum Quarter, {destination}"},
             {"name": "Restaurant Area", "location": f"Food District, {destination}"},
             {"name": "Shopping District", "location": f"Shopping Area, {destination}"}
-        ]
-        
-        destination_lower = destination.lower()
-        for city, attractions in attractions_data.items():
-            if city in destination_lower:
-                return attractions
-        
-        return default_attractions
\ No newline at end of file
+        )
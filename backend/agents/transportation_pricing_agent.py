@@ -1,72 +1,212 @@
 """
 LLM-Powered Transportation Pricing Agent
-Uses LangGraph workflow for intelligent, multi-step pricing analysis
+Runs a short async research pipeline (route, economics, local prices) for intelligent pricing analysis
 """
 
+import asyncio
 import json
-import re
-from typing import Dict, Any, List
-from typing_extensions import TypedDict, Annotated
-
-from langgraph.graph import StateGraph, END
-from langgraph.graph.message import add_messages
+import logging
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Sequence, Tuple
 
 from services.grok_service import GrokService
+from utils.caching import SingleFlight, TTLCache
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json parses the same text
+    _json_loads = json.loads
 
-class TransportationPricingState(TypedDict):
-    """State for transportation pricing workflow"""
-    origin: str
-    destination: str
-    distance_km: float
-    travelers: int
-    country: str
-    route_context: Dict[str, Any]
-    economic_context: Dict[str, Any]
-    pricing_research: Dict[str, Any]
-    calculated_costs: Dict[str, float]
-    final_prices: Dict[str, Dict[str, Any]]
-    confidence: float
-    reasoning: str
-    messages: Annotated[list, add_messages]
+logger = logging.getLogger(__name__)
 
+# Upper bound on Grok requests one pricing agent keeps in flight at a time
+LLM_CONCURRENCY = 4
 
-class TransportationPricingAgent:
-    """LLM-powered agent for intelligent transportation pricing"""
-    
-    def __init__(self, grok_service: GrokService):
-        self.grok_service = grok_service
-        self.workflow = self._create_workflow()
-    
-    def _create_workflow(self) -> StateGraph:
-        """Create the LangGraph workflow"""
-        workflow = StateGraph(TransportationPricingState)
-        
-        # Add nodes
-        workflow.add_node("analyze_route", self._analyze_route)
-        workflow.add_node("research_economics", self._research_economics)
-        workflow.add_node("research_local_prices", self._research_local_prices)
-        workflow.add_node("calculate_costs", self._calculate_costs)
-        workflow.add_node("validate_prices", self._validate_prices)
-        
-        # Define edges
-        workflow.set_entry_point("analyze_route")
-        workflow.add_edge("analyze_route", "research_economics")
-        workflow.add_edge("research_economics", "research_local_prices")
-        workflow.add_edge("research_local_prices", "calculate_costs")
-        workflow.add_edge("calculate_costs", "validate_prices")
-        workflow.add_edge("validate_prices", END)
-        
-        return workflow.compile()
-    
-    async def _analyze_route(self, state: TransportationPricingState) -> TransportationPricingState:
-        """LLM analyzes the route and context"""
-        print(f"🤖 Step 1: Analyzing route {state['origin']} → {state['destination']}")
-        
-        prompt = f"""Analyze this transportation route and provide context:
+# Upper bound on routes calculate_prices_batch prices at once
+PRICING_BATCH_CONCURRENCY = 8
+
+# Parsed Grok answers are reused for a day; economic context and fares change slowly
+LLM_RESPONSE_CACHE_TTL = 24 * 3600
+LLM_RESPONSE_CACHE_SIZE = 1024
+
+# Distance-based fares, realistic for developing countries like Sri Lanka:
+# price key -> (minimum USD, USD per km). Train and bus are per person, taxi is for the
+# whole car one-way and car rental is a daily rate. Also the floor for researched fares.
+_DISTANCE_FARES = MappingProxyType({
+    "train_price_usd": (0.40, 0.009),       # ~$0.40/person for 47km
+    "bus_price_usd": (0.55, 0.012),         # ~$0.55/person for 47km
+    "taxi_price_usd": (15, 0.32),           # ~$15 for 47km
+    "car_rental_daily_usd": (25, 0.53),     # ~$25 for 47km
+})
+
+# Researched fares checked against _DISTANCE_FARES; taxi and rental quotes vary too much to floor
+_FLOORED_FARES = ("train_price_usd", "bus_price_usd")
+
+# Used when the LLM answers but without usable data
+_FALLBACK_ROUTE_CONTEXT = MappingProxyType({
+    "country": "Unknown",
+    "route_type": "highway",
+    "economic_level": "developing",
+    "tourism_factor": "medium",
+    "infrastructure_quality": "fair",
+    "seasonal_impact": "low"
+})
+_FALLBACK_ECONOMIC_CONTEXT = MappingProxyType({
+    "monthly_income_usd": 500,
+    "gdp_per_capita": 10000,
+    "cost_of_living_index": 50,
+    "currency_rate": 1.0,
+    "transport_trends": "stable",
+    "public_subsidies": "medium"
+})
+
+# Used when the LLM call itself fails
+_ERROR_ROUTE_CONTEXT = MappingProxyType({"country": "Unknown", "route_type": "highway"})
+_ERROR_ECONOMIC_CONTEXT = MappingProxyType({"monthly_income_usd": 500, "gdp_per_capita": 10000})
+_ERROR_PRICING_RESEARCH = MappingProxyType({
+    "train_price_usd": 1.0,
+    "bus_price_usd": 1.5,
+    "taxi_price_usd": 20.0,
+    "car_rental_daily_usd": 30.0
+})
+
+
+def _load_country_economics() -> Dict[str, Dict[str, Any]]:
+    """Offline economic context per lowercase country name, from data/country_economics.json"""
+    try:
+        data_file = Path(__file__).parent.parent / "data" / "country_economics.json"
+        return _json_loads(data_file.read_bytes())["countries"]
+    except Exception as e:
+        logger.warning("Could not load country economics data: %s", e)
+        return {}
+
+
+# Countries listed here skip the economic-research LLM call
+_COUNTRY_ECONOMICS = MappingProxyType(_load_country_economics())
+
+
+@lru_cache(maxsize=2048)
+def _duration_strings(duration_mins: int) -> Tuple[str, str, str]:
+    """Train, bus and taxi duration labels for a trip of duration_mins minutes"""
+    hours = duration_mins // 60
+    return (
+        f"{hours}h {duration_mins % 60}m",
+        f"{hours}h {int((duration_mins * 1.2) % 60)}m",  # Buses ~20% slower
+        f"{hours}h"
+    )
+
+
+def _object_schema(properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(properties), "additionalProperties": False}
+
+
+# JSON schemas for structured Grok output, in the {"name", "schema"} form of response_format.json_schema
+_TEXT = {"type": "string"}
+_NUMBER = {"type": "number"}
+_ROUTE_CONTEXT_SCHEMA = _object_schema({
+    field: _TEXT
+    for field in ("country", "route_type", "economic_level", "tourism_factor", "infrastructure_quality", "seasonal_impact")
+})
+_ECONOMIC_CONTEXT_SCHEMA = _object_schema({
+    "monthly_income_usd": _NUMBER,
+    "gdp_per_capita": _NUMBER,
+    "cost_of_living_index": _NUMBER,
+    "currency_rate": _NUMBER,
+    "transport_trends": _TEXT,
+    "public_subsidies": _TEXT
+})
+_PRICING_RESEARCH_SCHEMA = _object_schema({
+    "train_price_usd": _NUMBER,
+    "bus_price_usd": _NUMBER,
+    "taxi_price_usd": _NUMBER,
+    "car_rental_daily_usd": _NUMBER,
+    "confidence": _TEXT,
+    "price_source": _TEXT
+})
+_ROUTE_CONTEXT_FORMAT = {"name": "route_context", "schema": _ROUTE_CONTEXT_SCHEMA}
+_ECONOMIC_CONTEXT_FORMAT = {"name": "economic_context", "schema": _ECONOMIC_CONTEXT_SCHEMA}
+_PRICING_RESEARCH_FORMAT = {"name": "pricing_research", "schema": _PRICING_RESEARCH_SCHEMA}
+_COMBINED_RESEARCH_FORMAT = {
+    "name": "route_research",
+    "schema": _object_schema({
+        "route": _ROUTE_CONTEXT_SCHEMA,
+        "economics": _ECONOMIC_CONTEXT_SCHEMA,
+        "pricing": _PRICING_RESEARCH_SCHEMA
+    })
+}
+# Field each combined-answer section must carry for the pipeline to use it
+_COMBINED_REQUIRED_FIELDS = (("route", "country"), ("economics", "gdp_per_capita"), ("pricing", "train_price_usd"))
+
+
+def _combined_research_complete(research: Any) -> bool:
+    """Whether a combined answer has every section the pipeline needs"""
+    return isinstance(research, dict) and all(
+        isinstance(research.get(section), dict) and field in research[section]
+        for section, field in _COMBINED_REQUIRED_FIELDS
+    )
+
+
+def _distance_fare(price_key: str, distance_km: float) -> float:
+    minimum, per_km = _DISTANCE_FARES[price_key]
+    return max(minimum, distance_km * per_km)
+
+
+# Prompt templates, filled from the pipeline state with str.format_map
+_COMBINED_RESEARCH_PROMPT = """Analyze this transportation route and research what locals actually pay to travel it:
+
+Route: {origin} → {destination}
+Distance: {distance_km} km
+
+Provide three sections:
+1. "route": country where this route is located, type of route (urban, rural, highway, coastal,
+   mountainous, etc.), economic development level (developed/developing), tourism level
+   (high/medium/low), infrastructure quality (excellent/good/fair/poor), seasonal impact on pricing
+2. "economics": for that country, average monthly income in USD, GDP per capita in USD, cost of
+   living index (USA = 100), approximate currency rate to USD, transportation cost trend
+   (stable/rising/falling), public transport subsidies (high/medium/low/none)
+3. "pricing": realistic prices in USD that locals ACTUALLY PAY on this route:
+   train ticket (2nd class, PER PERSON, one-way), inter-city bus ticket (PER PERSON, one-way),
+   taxi/private car (TOTAL for entire car, one-way), car rental (DAILY rate for entire car)
+
+Example: If local bus fare is LKR 180 per person, convert to USD (~$0.55) and provide that.
+
+Respond ONLY with valid JSON in this exact format:
+{{
+    "route": {{
+        "country": "Sri Lanka",
+        "route_type": "coastal highway",
+        "economic_level": "developing",
+        "tourism_factor": "high",
+        "infrastructure_quality": "good",
+        "seasonal_impact": "low"
+    }},
+    "economics": {{
+        "monthly_income_usd": 320,
+        "gdp_per_capita": 3720,
+        "cost_of_living_index": 45.2,
+        "currency_rate": 325.5,
+        "transport_trends": "stable",
+        "public_subsidies": "high"
+    }},
+    "pricing": {{
+        "train_price_usd": 0.45,
+        "bus_price_usd": 0.55,
+        "taxi_price_usd": 15.00,
+        "car_rental_daily_usd": 25.00,
+        "confidence": "high",
+        "price_source": "local market knowledge"
+    }}
+}}"""
+
+_ROUTE_ANALYSIS_PROMPT = """Analyze this transportation route and provide context:
 
-Route: {state['origin']} → {state['destination']}
-Distance: {state['distance_km']} km
+Route: {origin} → {destination}
+Distance: {distance_km} km
 
 Provide detailed analysis:
 1. Country where this route is located
@@ -85,47 +225,8 @@ Respond ONLY with valid JSON in this exact format:
     "infrastructure_quality": "good",
     "seasonal_impact": "low"
 }}"""
-        
-        try:
-            response = await self.grok_service.generate_response(
-                prompt,
-                system_message="You are a transportation analyst. Respond only with valid JSON.",
-                force_json=True
-            )
-            
-            # Extract JSON from response
-            route_context = self._extract_json(response)
-            
-            if route_context and "country" in route_context:
-                state["route_context"] = route_context
-                state["country"] = route_context["country"]
-                print(f"   ✓ Country: {state['country']}")
-                print(f"   ✓ Route type: {route_context.get('route_type', 'N/A')}")
-            else:
-                # Fallback
-                state["route_context"] = {
-                    "country": "Unknown",
-                    "route_type": "highway",
-                    "economic_level": "developing",
-                    "tourism_factor": "medium",
-                    "infrastructure_quality": "fair",
-                    "seasonal_impact": "low"
-                }
-                state["country"] = "Unknown"
-                print(f"   ⚠️ Using fallback route context")
-                
-        except Exception as e:
-            print(f"   ❌ Error in route analysis: {e}")
-            state["route_context"] = {"country": "Unknown", "route_type": "highway"}
-            state["country"] = "Unknown"
-        
-        return state
-    
-    async def _research_economics(self, state: TransportationPricingState) -> TransportationPricingState:
-        """LLM researches economic context"""
-        print(f"🤖 Step 2: Researching economic context for {state['country']}")
-        
-        prompt = f"""Research the economic context for transportation pricing in {state['country']}:
+
+_ECONOMICS_PROMPT = """Research the economic context for transportation pricing in {country}:
 
 Provide current economic data:
 1. Average monthly income in USD
@@ -144,58 +245,19 @@ Respond ONLY with valid JSON in this exact format:
     "transport_trends": "stable",
     "public_subsidies": "high"
 }}"""
-        
-        try:
-            response = await self.grok_service.generate_response(
-                prompt,
-                system_message="You are an economist. Provide accurate data. Respond only with valid JSON.",
-                force_json=True
-            )
-            
-            economic_context = self._extract_json(response)
-            
-            if economic_context and "gdp_per_capita" in economic_context:
-                state["economic_context"] = economic_context
-                print(f"   ✓ GDP per capita: ${economic_context.get('gdp_per_capita', 'N/A'):,}")
-                print(f"   ✓ Monthly income: ${economic_context.get('monthly_income_usd', 'N/A')}")
-            else:
-                # Fallback
-                state["economic_context"] = {
-                    "monthly_income_usd": 500,
-                    "gdp_per_capita": 10000,
-                    "cost_of_living_index": 50,
-                    "currency_rate": 1.0,
-                    "transport_trends": "stable",
-                    "public_subsidies": "medium"
-                }
-                print(f"   ⚠️ Using fallback economic context")
-                
-        except Exception as e:
-            print(f"   ❌ Error in economic research: {e}")
-            state["economic_context"] = {
-                "monthly_income_usd": 500,
-                "gdp_per_capita": 10000
-            }
-        
-        return state
-    
-    async def _research_local_prices(self, state: TransportationPricingState) -> TransportationPricingState:
-        """LLM researches actual local transportation prices"""
-        print(f"🤖 Step 3: Researching local transportation prices")
-        
-        prompt = f"""Research actual transportation prices for this specific route:
 
-Route: {state['origin']} → {state['destination']}
-Country: {state['country']}
-Distance: {state['distance_km']} km
-Economic context:
-- GDP per capita: ${state['economic_context'].get('gdp_per_capita', 'N/A')}
-- Average monthly income: ${state['economic_context'].get('monthly_income_usd', 'N/A')}
-- Route type: {state['route_context'].get('route_type', 'highway')}
-- Infrastructure: {state['route_context'].get('infrastructure_quality', 'fair')}
+_LOCAL_PRICES_PROMPT = """Research actual transportation prices for this specific route:
+
+Route: {origin} → {destination}
+Country: {country}
+Distance: {distance_km} km
+Route context:
+- Economic level: {economic_level}
+- Route type: {route_type}
+- Infrastructure: {infrastructure_quality}
 
-IMPORTANT: Provide realistic prices in USD that locals would ACTUALLY PAY in {state['country']}.
-For a {state['distance_km']} km route, research what the real local prices are.
+IMPORTANT: Provide realistic prices in USD that locals would ACTUALLY PAY in {country}.
+For a {distance_km} km route, research what the real local prices are.
 
 Example: If local bus fare is LKR 180 per person, convert to USD (~$0.55) and provide that.
 
@@ -216,123 +278,306 @@ Respond ONLY with valid JSON in this exact format:
     "confidence": "high",
     "price_source": "local market knowledge"
 }}"""
+
+
+def _object_end(text: str, start: int) -> int:
+    """Index of the brace closing the JSON object opened at start, or -1 if it never closes"""
+    depth = 0
+    in_string = escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return -1
+
+
+@dataclass(slots=True)
+class TransportationPricingState:
+    """State for the transportation pricing pipeline; each step updates it in place"""
+    origin: str
+    destination: str
+    distance_km: float
+    travelers: int
+    country: str = ""
+    route_context: Dict[str, Any] = field(default_factory=dict)
+    economic_context: Dict[str, Any] = field(default_factory=dict)
+    pricing_research: Dict[str, Any] = field(default_factory=dict)
+    
+    def prompt_fields(self) -> Dict[str, Any]:
+        """Placeholders shared by the prompt templates"""
+        return {
+            "origin": self.origin,
+            "destination": self.destination,
+            "distance_km": self.distance_km,
+            "country": self.country
+        }
+
+
+class TransportationPricingAgent:
+    """LLM-powered agent for intelligent transportation pricing"""
+    
+    def __init__(self, grok_service: GrokService):
+        self.grok_service = grok_service
+        self._llm_slots = asyncio.Semaphore(LLM_CONCURRENCY)
+        self._response_cache = TTLCache(LLM_RESPONSE_CACHE_SIZE, LLM_RESPONSE_CACHE_TTL)
+        self._response_inflight = SingleFlight()
+    
+    async def _ask_llm_json(self, key: tuple, prompt: str, system_message: str,
+                            is_complete: Callable[[Any], bool], response_format: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ask Grok for a JSON object matching response_format, cached under key. Only answers
+        passing is_complete are cached; concurrent asks for the same key share one call.
+        """
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        result = self._extract_json(await self._response_inflight.run(
+            key, lambda: self._ask_llm(prompt, system_message, response_format)
+        ))
+        
+        if is_complete(result):
+            self._response_cache.set(key, dict(result))
+        return result
+    
+    async def _ask_llm(self, prompt: str, system_message: str, response_format: Dict[str, Any]) -> str:
+        """
+        Stream a JSON prompt's answer from Grok, bounded by the agent's concurrency limit.
+        Stops reading as soon as the first JSON object in the answer is complete.
+        """
+        async with self._llm_slots:
+            text = ""
+            stream = self.grok_service.stream_response(
+                prompt, system_message=system_message, force_json=True, json_schema=response_format
+            )
+            async with aclosing(stream):
+                async for chunk in stream:
+                    text += chunk
+                    if "}" in chunk:
+                        start = text.find("{")
+                        if start >= 0 and _object_end(text, start) >= 0:
+                            break
+            return text
+    
+    async def _research_combined(self, state: TransportationPricingState) -> TransportationPricingState:
+        """LLM analyzes the route, economy and local prices in a single request"""
+        logger.debug("Researching %s -> %s in one request", state.origin, state.destination)
+        
+        prompt = _COMBINED_RESEARCH_PROMPT.format_map(state.prompt_fields())
         
         try:
-            response = await self.grok_service.generate_response(
-                prompt,
-                system_message="You are a local transportation expert. Provide realistic prices that locals pay. Respond only with valid JSON.",
-                force_json=True
+            key = ("combined", state.origin.strip().lower(), state.destination.strip().lower(), round(state.distance_km))
+            research = await self._ask_llm_json(
+                key, prompt,
+                "You research transportation routes, local economies and fares. Respond only with valid JSON.",
+                _combined_research_complete, _COMBINED_RESEARCH_FORMAT
+            )
+        except Exception as e:
+            logger.warning("Combined price research failed: %s", e)
+            return state
+        
+        if not _combined_research_complete(research):
+            logger.info("Incomplete combined research, researching step by step")
+            return state
+        
+        route_context, economic_context, pricing_research = (
+            dict(research[section]) for section, _ in _COMBINED_REQUIRED_FIELDS
+        )
+        state.route_context = route_context
+        state.country = route_context["country"]
+        # Prefer tabulated figures over the model's for countries we have data for
+        known_economics = _COUNTRY_ECONOMICS.get(str(state.country).strip().lower())
+        state.economic_context = dict(known_economics) if known_economics else economic_context
+        logger.debug("Country: %s", state.country)
+        self._accept_pricing_research(state, pricing_research)
+        return state
+    
+    async def _analyze_route(self, state: TransportationPricingState) -> TransportationPricingState:
+        """LLM analyzes the route and context"""
+        logger.debug("Analyzing route %s -> %s", state.origin, state.destination)
+        
+        prompt = _ROUTE_ANALYSIS_PROMPT.format_map(state.prompt_fields())
+        
+        try:
+            key = ("route", state.origin.strip().lower(), state.destination.strip().lower(), round(state.distance_km))
+            route_context = await self._ask_llm_json(
+                key, prompt, "You are a transportation analyst. Respond only with valid JSON.",
+                lambda answer: "country" in answer, _ROUTE_CONTEXT_FORMAT
             )
             
-            pricing_research = self._extract_json(response)
-            
-            if pricing_research and "train_price_usd" in pricing_research:
-                # Sanity check: ensure prices are not unrealistically low
-                train_price = pricing_research.get('train_price_usd', 0)
-                bus_price = pricing_research.get('bus_price_usd', 0)
-                
-                # Minimum per-person prices based on distance
-                # For Sri Lanka: train ~$0.40/person, bus ~$0.55/person for 47km
-                min_train = max(0.40, state['distance_km'] * 0.009)  # At least $0.40 or $0.009/km
-                min_bus = max(0.55, state['distance_km'] * 0.012)    # At least $0.55 or $0.012/km
-                
-                # Adjust if too low
-                if train_price < min_train:
-                    print(f"   ⚠️ Train price ${train_price} too low, adjusting to ${min_train:.2f}")
-                    pricing_research['train_price_usd'] = round(min_train, 2)
+            if route_context and "country" in route_context:
+                state.route_context = route_context
+                state.country = route_context["country"]
+                logger.debug("Country: %s, route type: %s", state.country, route_context.get('route_type', 'N/A'))
+            else:
+                state.route_context = dict(_FALLBACK_ROUTE_CONTEXT)
+                state.country = "Unknown"
+                logger.info("Using fallback route context")
                 
-                if bus_price < min_bus:
-                    print(f"   ⚠️ Bus price ${bus_price} too low, adjusting to ${min_bus:.2f}")
-                    pricing_research['bus_price_usd'] = round(min_bus, 2)
+        except Exception as e:
+            logger.warning("Route analysis failed: %s", e)
+            state.route_context = dict(_ERROR_ROUTE_CONTEXT)
+            state.country = "Unknown"
+        
+        return state
+    
+    async def _research_market(self, state: TransportationPricingState) -> TransportationPricingState:
+        """Research economic context and local prices concurrently; both only need the route analysis"""
+        await asyncio.gather(
+            self._research_economics(state),
+            self._research_local_prices(state)
+        )
+        return state
+    
+    async def _research_economics(self, state: TransportationPricingState) -> TransportationPricingState:
+        """LLM researches economic context, unless the country is in the offline table"""
+        known_economics = _COUNTRY_ECONOMICS.get(str(state.country).strip().lower())
+        if known_economics:
+            state.economic_context = dict(known_economics)
+            return state
+        
+        logger.debug("Researching economic context for %s", state.country)
+        
+        prompt = _ECONOMICS_PROMPT.format_map(state.prompt_fields())
+        
+        try:
+            economic_context = await self._ask_llm_json(
+                ("economics", state.country.strip().lower()),
+                prompt, "You are an economist. Provide accurate data. Respond only with valid JSON.",
+                lambda answer: "gdp_per_capita" in answer, _ECONOMIC_CONTEXT_FORMAT
+            )
+            
+            if economic_context and "gdp_per_capita" in economic_context:
+                state.economic_context = economic_context
+                logger.debug(
+                    "GDP per capita: $%s, monthly income: $%s",
+                    economic_context.get('gdp_per_capita', 'N/A'), economic_context.get('monthly_income_usd', 'N/A')
+                )
+            else:
+                state.economic_context = dict(_FALLBACK_ECONOMIC_CONTEXT)
+                logger.info("Using fallback economic context")
                 
-                state["pricing_research"] = pricing_research
-                print(f"   ✓ Train: ${pricing_research.get('train_price_usd', 'N/A')}/person")
-                print(f"   ✓ Bus: ${pricing_research.get('bus_price_usd', 'N/A')}/person")
-                print(f"   ✓ Taxi: ${pricing_research.get('taxi_price_usd', 'N/A')} total")
+        except Exception as e:
+            logger.warning("Economic research failed: %s", e)
+            state.economic_context = dict(_ERROR_ECONOMIC_CONTEXT)
+        
+        return state
+    
+    async def _research_local_prices(self, state: TransportationPricingState) -> TransportationPricingState:
+        """LLM researches actual local transportation prices"""
+        logger.debug("Researching local transportation prices")
+        
+        prompt = _LOCAL_PRICES_PROMPT.format_map({
+            **state.prompt_fields(),
+            "economic_level": state.route_context.get('economic_level', 'developing'),
+            "route_type": state.route_context.get('route_type', 'highway'),
+            "infrastructure_quality": state.route_context.get('infrastructure_quality', 'fair')
+        })
+        
+        try:
+            key = (
+                "pricing", state.origin.strip().lower(), state.destination.strip().lower(),
+                round(state.distance_km / 5) * 5, state.route_context.get('route_type')
+            )
+            pricing_research = await self._ask_llm_json(
+                key, prompt,
+                "You are a local transportation expert. Provide realistic prices that locals pay. Respond only with valid JSON.",
+                lambda answer: "train_price_usd" in answer, _PRICING_RESEARCH_FORMAT
+            )
+            
+            if pricing_research and "train_price_usd" in pricing_research:
+                self._accept_pricing_research(state, pricing_research)
             else:
-                # Fallback based on distance - realistic for developing countries like Sri Lanka
-                state["pricing_research"] = {
-                    "train_price_usd": round(max(0.40, state['distance_km'] * 0.009), 2),  # ~$0.40/person for 47km
-                    "bus_price_usd": round(max(0.55, state['distance_km'] * 0.012), 2),    # ~$0.55/person for 47km
-                    "taxi_price_usd": round(max(15, state['distance_km'] * 0.32), 2),       # ~$15 for 47km
-                    "car_rental_daily_usd": round(max(25, state['distance_km'] * 0.53), 2), # ~$25 for 47km
+                # Fallback based on distance
+                state.pricing_research = {
+                    **{key: round(_distance_fare(key, state.distance_km), 2) for key in _DISTANCE_FARES},
                     "confidence": "medium",
                     "price_source": "distance-based estimation"
                 }
-                print(f"   ⚠️ Using fallback pricing")
+                logger.info("Using fallback pricing")
                 
         except Exception as e:
-            print(f"   ❌ Error in price research: {e}")
-            state["pricing_research"] = {
-                "train_price_usd": 1.0,
-                "bus_price_usd": 1.5,
-                "taxi_price_usd": 20.0,
-                "car_rental_daily_usd": 30.0
-            }
+            logger.warning("Price research failed: %s", e)
+            state.pricing_research = dict(_ERROR_PRICING_RESEARCH)
         
         return state
     
-    async def _calculate_costs(self, state: TransportationPricingState) -> TransportationPricingState:
-        """Calculate final costs with simple arithmetic (no LLM needed for math)"""
-        print(f"🤖 Step 4: Calculating costs for {state['travelers']} travelers")
-        
-        research = state["pricing_research"]
+    def _accept_pricing_research(self, state: TransportationPricingState, pricing_research: Dict[str, Any]):
+        """Store researched prices in the state, raising unrealistically low fares to a distance-based floor"""
+        # Sanity check: per-person fares may not fall below their distance-based minimum
+        for price_key in _FLOORED_FARES:
+            price = pricing_research.get(price_key, 0)
+            minimum = _distance_fare(price_key, state.distance_km)
+            if price < minimum:
+                logger.info("%s $%s too low, adjusting to $%.2f", price_key, price, minimum)
+                pricing_research[price_key] = round(minimum, 2)
         
+        state.pricing_research = pricing_research
+        logger.debug(
+            "Researched prices: train $%s/person, bus $%s/person, taxi $%s total",
+            pricing_research.get('train_price_usd', 'N/A'), pricing_research.get('bus_price_usd', 'N/A'),
+            pricing_research.get('taxi_price_usd', 'N/A')
+        )
+    
+    def _calculate_costs(self, research: Dict[str, Any], travelers: int) -> Dict[str, float]:
+        """Calculate final costs with simple arithmetic (no LLM needed for math)"""
         # Simple, direct calculation - don't use LLM for basic math
         # Train and bus are per-person, multiply by travelers
-        train_total = round(research.get('train_price_usd', 0) * state['travelers'], 2)
-        bus_total = round(research.get('bus_price_usd', 0) * state['travelers'], 2)
+        train_total = round(research.get('train_price_usd', 0) * travelers, 2)
+        bus_total = round(research.get('bus_price_usd', 0) * travelers, 2)
         
         # Taxi and car rental are shared costs (total for all)
         taxi_total = round(research.get('taxi_price_usd', 0), 2)
         car_rental_total = round(research.get('car_rental_daily_usd', 0), 2)
         
-        state["calculated_costs"] = {
+        logger.debug(
+            "Costs for %d travelers: train $%s, bus $%s, taxi $%s, car rental $%s",
+            travelers, train_total, bus_total, taxi_total, car_rental_total
+        )
+        
+        return {
             "train_total": train_total,
             "bus_total": bus_total,
             "taxi_total": taxi_total,
             "car_rental_total": car_rental_total,
         }
-        
-        state["reasoning"] = (
-            f"Train/bus: per-person prices × {state['travelers']} travelers. "
-            f"Taxi/car: shared costs for all travelers."
-        )
-        
-        print(f"   ✓ Train: ${research.get('train_price_usd', 0)}/person × {state['travelers']} = ${train_total}")
-        print(f"   ✓ Bus: ${research.get('bus_price_usd', 0)}/person × {state['travelers']} = ${bus_total}")
-        print(f"   ✓ Taxi: ${taxi_total} (shared)")
-        print(f"   ✓ Car rental: ${car_rental_total} (shared)")
-        
-        return state
     
-    async def _validate_prices(self, state: TransportationPricingState) -> TransportationPricingState:
+    def _format_final_prices(self, costs: Dict[str, float], distance_km: float) -> Dict[str, Dict[str, Any]]:
         """Format final prices with additional details (using direct calculation, not LLM)"""
-        print(f"🤖 Step 5: Formatting final prices")
-        
-        costs = state["calculated_costs"]
-        
         # Calculate duration based on distance
-        duration_mins = max(30, int(state['distance_km'] * 1.2))  # ~1.2 min per km
-        duration_str = f"{duration_mins // 60}h {duration_mins % 60}m"
+        duration_mins = max(30, int(distance_km * 1.2))  # ~1.2 min per km
+        train_duration, bus_duration, taxi_duration = _duration_strings(duration_mins)
         
         # Format prices directly without LLM (to preserve corrected prices)
-        state["final_prices"] = {
+        return {
             "train": {
                 "cost": costs.get('train_total', 0),
-                "duration": duration_str,
+                "duration": train_duration,
                 "quality": "comfortable",
                 "booking": "station or online"
             },
             "bus": {
                 "cost": costs.get('bus_total', 0),
-                "duration": f"{duration_mins // 60}h {int((duration_mins * 1.2) % 60)}m",  # Buses ~20% slower
+                "duration": bus_duration,
                 "quality": "basic but reliable",
                 "booking": "bus terminal or flag down"
             },
             "taxi": {
                 "cost": costs.get('taxi_total', 0),
-                "duration": f"{duration_mins // 60}h",
+                "duration": taxi_duration,
                 "quality": "comfortable",
                 "booking": "hotel or app"
             },
@@ -343,28 +588,20 @@ Respond ONLY with valid JSON in this exact format:
                 "booking": "rental agency"
             }
         }
-        
-        state["confidence"] = 0.9  # High confidence since we used validated prices
-        
-        print(f"   ✓ Train: ${costs.get('train_total', 0)} ({duration_str})")
-        print(f"   ✓ Bus: ${costs.get('bus_total', 0)} ({duration_mins // 60}h {int((duration_mins * 1.2) % 60)}m)")
-        print(f"   ✓ Taxi: ${costs.get('taxi_total', 0)} ({duration_mins // 60}h)")
-        print(f"   ✓ Car rental: ${costs.get('car_rental_total', 0)} (flexible)")
-        
-        return state
     
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """Extract JSON from LLM response"""
         try:
             # Try direct parsing
-            return json.loads(text)
-        except:
-            # Try to find JSON in text
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
+            return _json_loads(text)
+        except (ValueError, TypeError):
+            # Fall back to the first balanced {...} block in the text
+            start = text.find("{") if isinstance(text, str) else -1
+            end = _object_end(text, start) if start >= 0 else -1
+            if end >= 0:
                 try:
-                    return json.loads(json_match.group())
-                except:
+                    return _json_loads(text[start:end + 1])
+                except ValueError:
                     pass
             return {}
     
@@ -376,44 +613,41 @@ Respond ONLY with valid JSON in this exact format:
         travelers: int
     ) -> Dict[str, Any]:
         """Main entry point for pricing calculation"""
-        print(f"\n{'='*70}")
-        print(f"🤖 LLM PRICING AGENT: {origin} → {destination}")
-        print(f"{'='*70}")
+        logger.debug("LLM pricing agent: %s -> %s", origin, destination)
         
-        initial_state = TransportationPricingState(
+        state = TransportationPricingState(
             origin=origin,
             destination=destination,
             distance_km=distance_km,
-            travelers=travelers,
-            country="",
-            route_context={},
-            economic_context={},
-            pricing_research={},
-            calculated_costs={},
-            final_prices={},
-            confidence=0.0,
-            reasoning="",
-            messages=[]
+            travelers=travelers
         )
         
         try:
-            # Run the workflow
-            final_state = await self.workflow.ainvoke(initial_state)
+            # One combined Grok call first; research step by step only if its answer is incomplete
+            await self._research_combined(state)
+            if not state.pricing_research:
+                await self._analyze_route(state)
+                await self._research_market(state)
             
-            print(f"\n✅ Pricing complete! Confidence: {final_state.get('confidence', 0):.0%}")
-            print(f"{'='*70}\n")
+            costs = self._calculate_costs(state.pricing_research, travelers)
+            final_prices = self._format_final_prices(costs, distance_km)
+            confidence = 0.9  # High confidence since we used validated prices
+            
+            logger.debug("Pricing complete, confidence %.0f%%", confidence * 100)
             
             return {
-                "prices": final_state.get("final_prices", {}),
-                "confidence": final_state.get("confidence", 0.5),
-                "reasoning": final_state.get("reasoning", ""),
-                "country": final_state.get("country", "Unknown"),
-                "economic_context": final_state.get("economic_context", {}),
-                "route_context": final_state.get("route_context", {})
+                "prices": final_prices,
+                "confidence": confidence,
+                "reasoning": (
+                    f"Train/bus: per-person prices × {travelers} travelers. "
+                    f"Taxi/car: shared costs for all travelers."
+                ),
+                "country": state.country,
+                "economic_context": state.economic_context,
+                "route_context": state.route_context
             }
         except Exception as e:
-            print(f"\n❌ Pricing workflow error: {e}")
-            print(f"{'='*70}\n")
+            logger.warning("Pricing pipeline error: %s", e)
             return {
                 "prices": {},
                 "confidence": 0.0,
@@ -422,4 +656,17 @@ Respond ONLY with valid JSON in this exact format:
                 "economic_context": {},
                 "route_context": {}
             }
-
+    
+    async def calculate_prices_batch(self, routes: Sequence[Tuple[str, str, float, int]]) -> List[Dict[str, Any]]:
+        """
+        Price several (origin, destination, distance_km, travelers) routes concurrently,
+        e.g. the legs of a multi-city trip. Results are in the order of routes; legs in
+        the same country share cached economic research.
+        """
+        slots = asyncio.Semaphore(PRICING_BATCH_CONCURRENCY)
+        
+        async def price(route: Tuple[str, str, float, int]) -> Dict[str, Any]:
+            async with slots:
+                return await self.calculate_prices(*route)
+        
+        return list(await asyncio.gather(*(price(route) for route in routes)))
@@ -1,5 +1,13 @@
 import asyncio
-from typing import Dict, Any, List
+import logging
+import operator
+import os
+import random
+import time
+import httpx
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import uuid
 
@@ -15,11 +23,89 @@ from .transportation_agent import TransportationAgent
 from .cost_estimation_agent import CostEstimationAgent
 from .recommendation_agent import RecommendationAgent
 
-from models.travel_models import TravelRequest, TravelResponse, Flight, Hotel, DayItinerary, CostBreakdown, SeasonRecommendation
+from models.travel_models import AgentResponse, TravelRequest, TravelResponse, Flight, Hotel, DayItinerary, CostBreakdown, SeasonRecommendation
 from services.config import Settings
 from services.domestic_travel_analyzer import TransportationStrategyCache
 from services.distance_calculator import DistanceCalculator
 from services.airport_resolver import AirportResolver
+from utils.caching import SingleFlight, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached travel plans; entries expire after settings.cache_ttl
+RESPONSE_CACHE_SIZE = 256
+
+# Upper bound on memoized (origin, destination) travel-type decisions; entries expire after settings.cache_ttl
+TRAVEL_TYPE_CACHE_SIZE = 5000
+
+# State each request-only stage writes. When a run fails partway, these outputs are kept
+# so a retry of the same request skips the stages that already succeeded
+_RESUMABLE_OUTPUTS = MappingProxyType({
+    "travel_type_analyzer": ("skip_flight_search", "is_domestic_travel", "travel_distance_km"),
+    "emotional_intelligence": ("emotional_analysis",),
+    "flight_search": ("flights", "flights_serialized", "price_trends"),
+    "hotel_search": ("hotels", "hotels_serialized")
+})
+
+# Seeded from os.urandom once per process (reseeded in forked workers);
+# request ids only need to be unique, not unpredictable
+_request_id_rng = random.Random()
+os.register_at_fork(after_in_child=_request_id_rng.seed)
+
+def _new_request_id() -> str:
+    """Random version-4 UUID string, without reading os.urandom for every response"""
+    return str(uuid.UUID(int=_request_id_rng.getrandbits(128), version=4))
+
+# Season lookup tables, indexed by month (1-12) or keyed by season/vibe name
+_SEASON_BY_MONTH = (
+    None,
+    "winter", "winter",
+    "spring", "spring", "spring",
+    "summer", "summer", "summer",
+    "autumn", "autumn", "autumn",
+    "winter"
+)
+
+_OPTIMAL_SEASONS_BY_VIBE = MappingProxyType({
+    "romantic": ("spring", "autumn"),
+    "adventure": ("summer", "autumn"),
+    "beach": ("summer",),
+    "nature": ("spring", "autumn"),
+    "cultural": ("autumn", "spring"),
+    "culinary": ("autumn", "spring"),
+    "wellness": ("winter", "spring")
+})
+_DEFAULT_OPTIMAL_SEASONS = ("spring", "summer", "autumn")
+
+_SEASON_MONTHS = MappingProxyType({
+    "winter": (12, 1, 2),
+    "spring": (3, 4, 5),
+    "summer": (6, 7, 8),
+    "autumn": (9, 10, 11)
+})
+
+_WEATHER_CONSIDERATIONS = MappingProxyType({
+    "winter": ("Pack warm clothing", "Check for snow conditions", "Book indoor activities"),
+    "spring": ("Pack layers", "Expect occasional rain", "Enjoy blooming flowers"),
+    "summer": ("Stay hydrated", "Use sunscreen", "Book air-conditioned activities"),
+    "autumn": ("Pack warm layers", "Enjoy fall colors", "Check for seasonal closures")
+})
+_DEFAULT_WEATHER_CONSIDERATIONS = ("Check local weather forecast",)
+
+@lru_cache(maxsize=64)
+def _alternative_months(optimal_seasons: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Sorted months covered by the given seasons"""
+    months = set()
+    for season in optimal_seasons:
+        months.update(_SEASON_MONTHS.get(season, ()))
+    return tuple(sorted(months))
+
+@lru_cache(maxsize=64)
+def _season_recommendation_message(vibe: str, current_season: str, optimal_seasons: Tuple[str, ...]) -> str:
+    """Season recommendation message for a vibe and travel season"""
+    if current_season in optimal_seasons:
+        return f"Perfect timing! {current_season.title()} is ideal for {vibe} experiences."
+    return f"Consider visiting in {optimal_seasons[0]} for the best {vibe} experience, but {current_season} can still be enjoyable."
 
 class TravelState(TypedDict):
     """State for the travel planning workflow"""
@@ -27,13 +113,16 @@ class TravelState(TypedDict):
     emotional_analysis: Dict[str, Any]
     flights: List[Flight]
     hotels: List[Hotel]
+    flights_serialized: List[Dict[str, Any]]  # flights dumped once for downstream agent contexts
+    hotels_serialized: List[Dict[str, Any]]  # hotels dumped once for downstream agent contexts
+    search_context: Dict[str, Any]  # emotional analysis and search results, in the shape downstream agents read
     transportation: Dict[str, Any]
     cost_breakdown: CostBreakdown
     itinerary: List[DayItinerary]
     recommendations: List[str]
     season_recommendation: SeasonRecommendation
-    errors: List[str]
-    completed_agents: List[str]
+    errors: Annotated[List[str], operator.add]  # nodes return only their new entries
+    completed_agents: Annotated[List[str], operator.add]
     price_trends: Dict[str, Any]  # Price calendar data
     skip_flight_search: bool  # Whether to skip flight search for domestic travel
     is_domestic_travel: bool  # Whether this is domestic travel
@@ -50,16 +139,30 @@ class TravelOrchestrator:
         self.strategy_cache = TransportationStrategyCache()
         self.distance_calculator = None
         self.airport_resolver = None
+        self.http_client = None
+        self._season_rec_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._agent_slots: Dict[str, asyncio.Semaphore] = {}
+        self.agent_wait_seconds: Dict[str, float] = {}
+        self._response_cache = TTLCache(RESPONSE_CACHE_SIZE, settings.cache_ttl)
+        self._response_inflight = SingleFlight()
+        self._partial_results = TTLCache(RESPONSE_CACHE_SIZE, settings.cache_ttl)
+        self._travel_type_cache = TTLCache(TRAVEL_TYPE_CACHE_SIZE, settings.cache_ttl)
     
     async def initialize(self):
         """Initialize all agents and create the workflow graph"""
-        print("🚀 Initializing Travel Orchestrator...")
+        logger.info("🚀 Initializing Travel Orchestrator...")
+        
+        # One keep-alive pool for the SERP searches, so flight and hotel lookups share connections
+        self.http_client = httpx.AsyncClient(
+            timeout=self.settings.api_timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
         
         # Initialize all agents
         self.agents = {
             "emotional_intelligence": EmotionalIntelligenceAgent(self.settings),
-            "flight_search": FlightSearchAgent(self.settings),
-            "hotel_search": HotelSearchAgent(self.settings),
+            "flight_search": FlightSearchAgent(self.settings, self.http_client),
+            "hotel_search": HotelSearchAgent(self.settings, self.http_client),
             "transportation": TransportationAgent(self.settings),
             "cost_estimation": CostEstimationAgent(self.settings),
             "recommendation": RecommendationAgent(self.settings)
@@ -68,7 +171,12 @@ class TravelOrchestrator:
         # Initialize each agent
         for name, agent in self.agents.items():
             await agent.initialize()
-            print(f"✅ {name} agent initialized")
+            logger.info("✅ %s agent initialized", name)
+        
+        # Cap in-flight calls per agent type across concurrent requests, so a burst of
+        # requests can't flood one upstream API or starve the cheaper agents
+        self._agent_slots = {name: asyncio.Semaphore(self.settings.max_concurrent_agents) for name in self.agents}
+        self.agent_wait_seconds = {name: 0.0 for name in self.agents}
         
         # Initialize domestic travel services
         self.airport_resolver = AirportResolver(self.settings.serp_api_key)
@@ -78,13 +186,28 @@ class TravelOrchestrator:
         gmaps_client = transport_agent.gmaps_client if hasattr(transport_agent, 'gmaps_client') else None
         self.distance_calculator = DistanceCalculator(self.settings, gmaps_client)
         
-        print("✅ Domestic travel analyzer initialized")
+        logger.info("✅ Domestic travel analyzer initialized")
+        
+        # Every (vibe, season) recommendation is static, so build them all up front
+        self._season_rec_cache = {
+            (vibe, season): self._build_season_recommendation(vibe, season)
+            for vibe in _OPTIMAL_SEASONS_BY_VIBE
+            for season in (*_SEASON_MONTHS, "unknown")
+        }
         
         # Create the workflow graph
         self._create_workflow_graph()
         
         self.initialized = True
-        print("🎯 Travel Orchestrator fully initialized!")
+        logger.info("🎯 Travel Orchestrator fully initialized!")
+    
+    async def shutdown(self):
+        """Release resources held by the agents and the shared HTTP client"""
+        for agent in self.agents.values():
+            await agent.shutdown()
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
     
     def _create_workflow_graph(self):
         """Create the LangGraph workflow for travel planning with conditional routing"""
@@ -93,7 +216,7 @@ class TravelOrchestrator:
         # Add nodes for each agent
         workflow.add_node("analyze_travel_type", self._analyze_travel_type)
         workflow.add_node("emotional_intelligence", self._run_emotional_intelligence_agent)
-        workflow.add_node("flight_search", self._run_flight_search_agent)
+        workflow.add_node("parallel_search", self._run_flight_and_hotel_parallel)
         workflow.add_node("hotel_search", self._run_hotel_search_agent)
         workflow.add_node("transportation_node", self._run_transportation_agent)
         workflow.add_node("cost_estimation", self._run_cost_estimation_agent)
@@ -111,15 +234,21 @@ class TravelOrchestrator:
             "emotional_intelligence",
             self._route_after_emotional_intelligence,
             {
-                "flight_search": "flight_search",
+                "flight_search": "parallel_search",
                 "hotel_search": "hotel_search"
             }
         )
         
-        # Flight search routes to hotel search
-        workflow.add_edge("flight_search", "hotel_search")
-        
-        # Hotel search routes to transportation
+        # Flight and hotel searches are independent, so both paths go straight to transportation,
+        # unless the flight search this trip depends on failed
+        workflow.add_conditional_edges(
+            "parallel_search",
+            self._route_after_search,
+            {
+                "ok": "transportation_node",
+                "abort": "finalize"
+            }
+        )
         workflow.add_edge("hotel_search", "transportation_node")
         
         # Transportation runs after hotels
@@ -138,11 +267,58 @@ class TravelOrchestrator:
         self.graph = workflow.compile()
     
     async def process_travel_request(self, request: TravelRequest) -> TravelResponse:
-        """Process a travel request through all agents"""
+        """
+        Process a travel request through all agents.
+        Identical requests are served from a TTL'd LRU cache, and concurrent
+        identical requests share a single run of the workflow.
+        """
         if not self.initialized:
             raise RuntimeError("Orchestrator not initialized")
         
-        print(f"🎯 Processing travel request: {request.origin} → {request.destination}")
+        if not self.settings.enable_caching:
+            response, _ = await self._run_travel_request(request)
+            return response
+        
+        key = self._response_cache_key(request)
+        
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.info("⚡ Serving cached travel plan: %s → %s", request.origin, request.destination)
+            return self._reissue_response(cached)
+        
+        response, complete = await self._response_inflight.run(key, lambda: self._run_travel_request(request))
+        
+        # Plans built around a failed agent are not cached, so the next request retries it
+        if complete:
+            self._response_cache.set(key, response)
+        
+        return self._reissue_response(response)
+    
+    @staticmethod
+    def _response_cache_key(request: TravelRequest) -> tuple:
+        """Cache key covering every request field that shapes the travel plan"""
+        return (
+            request.origin,
+            request.destination,
+            request.start_date,
+            request.return_date,
+            request.travelers,
+            request.budget,
+            request.vibe.value,
+            request.include_price_trends
+        )
+    
+    @staticmethod
+    def _reissue_response(response: TravelResponse) -> TravelResponse:
+        """Copy a shared travel plan with its own request id and timestamp"""
+        return response.model_copy(update={
+            "request_id": _new_request_id(),
+            "generated_at": datetime.now()
+        })
+    
+    async def _run_travel_request(self, request: TravelRequest) -> Tuple[TravelResponse, bool]:
+        """Run the workflow for a request; also reports whether every agent succeeded"""
+        logger.info("🎯 Processing travel request: %s → %s", request.origin, request.destination)
         
         # Create initial state
         initial_state = TravelState(
@@ -150,6 +326,9 @@ class TravelOrchestrator:
             emotional_analysis={},
             flights=[],
             hotels=[],
+            flights_serialized=[],
+            hotels_serialized=[],
+            search_context={},
             transportation={},
             cost_breakdown=CostBreakdown(),
             itinerary=[],
@@ -168,33 +347,74 @@ class TravelOrchestrator:
             travel_distance_km=0.0
         )
         
+        # Resume from the stages an earlier failed run of this request completed
+        key = self._response_cache_key(request)
+        partial = self._partial_results.pop(key)
+        if partial is not None:
+            initial_state.update(partial)
+            logger.info("♻️ Resuming after: %s", ', '.join(partial['completed_agents']))
+        
         # Run the workflow
         try:
             final_state = await self.graph.ainvoke(initial_state)
             
+            if final_state["errors"]:
+                self._save_partial_results(key, final_state)
+            
             # Create the response
             response = self._create_travel_response(final_state)
             
-            print("✅ Travel request processed successfully")
-            return response
+            logger.info("✅ Travel request processed successfully")
+            return response, not final_state["errors"]
             
         except Exception as e:
-            print(f"❌ Error processing travel request: {e}")
+            logger.error("❌ Error processing travel request: %s", e)
             raise
     
-    async def _analyze_travel_type(self, state: TravelState) -> TravelState:
+    def _save_partial_results(self, key: tuple, state: TravelState):
+        """Keep the request-only stage outputs of a failed run for a retry to reuse"""
+        completed = [name for name in state["completed_agents"] if name in _RESUMABLE_OUTPUTS]
+        if not completed:
+            return
+        
+        saved: Dict[str, Any] = {"completed_agents": completed}
+        for name in completed:
+            for field in _RESUMABLE_OUTPUTS[name]:
+                saved[field] = state[field]
+        
+        self._partial_results.set(key, saved)
+    
+    async def _analyze_travel_type(self, state: TravelState) -> Dict[str, Any]:
         """Analyze travel type to determine if flight search should be skipped"""
-        print("🔍 Analyzing travel type (domestic vs international)...")
+        if "travel_type_analyzer" in state["completed_agents"]:
+            return {}
+        
+        logger.info("🔍 Analyzing travel type (domestic vs international)...")
+        
+        request = state["request"]
+        route_key = (request.origin.strip().lower(), request.destination.strip().lower())
+        cached = self._travel_type_cache.get(route_key)
+        if cached is not None:
+            skip_flights, is_domestic, distance = cached
+            logger.info("✅ Travel type for %s → %s from cache", request.origin, request.destination)
+            return {
+                "skip_flight_search": skip_flights,
+                "is_domestic_travel": is_domestic,
+                "travel_distance_km": distance,
+                "completed_agents": ["travel_type_analyzer"]
+            }
+        
+        update: Dict[str, Any] = {}
         
         try:
-            request = state["request"]
-            
             # Get airport codes for both origin and destination
-            origin_airport = await self.airport_resolver.get_airport_code(request.origin)
-            dest_airport = await self.airport_resolver.get_airport_code(request.destination)
+            origin_airport, dest_airport = await self._gather_lookups(
+                self.airport_resolver.get_airport_code(request.origin),
+                self.airport_resolver.get_airport_code(request.destination)
+            )
             
-            print(f"   Origin: {request.origin} → {origin_airport}")
-            print(f"   Destination: {request.destination} → {dest_airport}")
+            logger.info("   Origin: %s → %s", request.origin, origin_airport)
+            logger.info("   Destination: %s → %s", request.destination, dest_airport)
             
             # Case 1: Same airport code (e.g., Galle and Colombo both = CMB)
             if origin_airport == dest_airport and origin_airport != "UNKNOWN":
@@ -204,37 +424,36 @@ class TravelOrchestrator:
                     request.destination
                 )
                 
-                state["skip_flight_search"] = True
-                state["is_domestic_travel"] = True
-                state["travel_distance_km"] = distance if distance else 0.0
-                print(f"✅ Same airport detected ({origin_airport}) - Skipping flight search")
-                print(f"   This is domestic ground travel within the same region")
+                update["skip_flight_search"] = True
+                update["is_domestic_travel"] = True
+                update["travel_distance_km"] = distance if distance else 0.0
+                logger.info("✅ Same airport detected (%s) - Skipping flight search", origin_airport)
+                logger.info("   This is domestic ground travel within the same region")
                 if distance:
-                    print(f"   Distance: {distance:.1f} km")
-                return state
+                    logger.info("   Distance: %.1f km", distance)
+                    self._remember_travel_type(route_key, update)
+                update["completed_agents"] = ["travel_type_analyzer"]
+                return update
             
             # Case 2: Different airports - check distance and country
             if origin_airport != "UNKNOWN" and dest_airport != "UNKNOWN":
-                # Detect countries
-                origin_country = await self.airport_resolver.get_country_for_city(request.origin)
-                dest_country = await self.airport_resolver.get_country_for_city(request.destination)
-                
-                print(f"   Origin Country: {origin_country}")
-                print(f"   Destination Country: {dest_country}")
-                
-                # Calculate distance
-                distance = await self.distance_calculator.calculate_distance(
-                    request.origin,
-                    request.destination
+                # Detect countries and calculate distance concurrently
+                origin_country, dest_country, distance = await self._gather_lookups(
+                    self.airport_resolver.get_country_for_city(request.origin),
+                    self.airport_resolver.get_country_for_city(request.destination),
+                    self.distance_calculator.calculate_distance(request.origin, request.destination)
                 )
                 
+                logger.info("   Origin Country: %s", origin_country)
+                logger.info("   Destination Country: %s", dest_country)
+                
                 if distance:
-                    state["travel_distance_km"] = distance
-                    print(f"   Distance: {distance:.1f} km")
+                    update["travel_distance_km"] = distance
+                    logger.info("   Distance: %.1f km", distance)
                     
                     # Check if same country
                     if origin_country and dest_country and origin_country.lower() == dest_country.lower():
-                        state["is_domestic_travel"] = True
+                        update["is_domestic_travel"] = True
                         
                         # Get country-specific transportation strategy
                         strategy = await self.strategy_cache.get_strategy(origin_country, self.settings)
@@ -242,272 +461,319 @@ class TravelOrchestrator:
                         
                         # Decide whether to skip flight search
                         if distance <= max_ground_distance:
-                            state["skip_flight_search"] = True
-                            print(f"✅ Domestic travel within {origin_country}")
-                            print(f"   Distance ({distance:.1f} km) ≤ Max ground distance ({max_ground_distance} km)")
-                            print(f"   Skipping flight search - Ground transport recommended")
+                            update["skip_flight_search"] = True
+                            logger.info("✅ Domestic travel within %s", origin_country)
+                            logger.info("   Distance (%.1f km) ≤ Max ground distance (%s km)", distance, max_ground_distance)
+                            logger.info("   Skipping flight search - Ground transport recommended")
                         else:
-                            state["skip_flight_search"] = False
-                            print(f"✅ Domestic travel within {origin_country}")
-                            print(f"   Distance ({distance:.1f} km) > Max ground distance ({max_ground_distance} km)")
-                            print(f"   Including flight search - Long distance requires air travel")
+                            update["skip_flight_search"] = False
+                            logger.info("✅ Domestic travel within %s", origin_country)
+                            logger.info("   Distance (%.1f km) > Max ground distance (%s km)", distance, max_ground_distance)
+                            logger.info("   Including flight search - Long distance requires air travel")
                     else:
                         # International travel
-                        state["is_domestic_travel"] = False
-                        state["skip_flight_search"] = False
-                        print(f"✅ International travel detected")
-                        print(f"   From {origin_country} to {dest_country}")
-                        print(f"   Including flight search")
+                        update["is_domestic_travel"] = False
+                        update["skip_flight_search"] = False
+                        logger.info("✅ International travel detected")
+                        logger.info("   From %s to %s", origin_country, dest_country)
+                        logger.info("   Including flight search")
+                    
+                    # Only decisions built from resolved airports and a known distance are reused;
+                    # the fallbacks below may stem from a transient lookup failure
+                    self._remember_travel_type(route_key, update)
                 else:
                     # Could not calculate distance, default to including flights
-                    state["skip_flight_search"] = False
-                    state["is_domestic_travel"] = False
-                    print(f"⚠️ Could not calculate distance - Including flight search by default")
+                    update["skip_flight_search"] = False
+                    update["is_domestic_travel"] = False
+                    logger.warning("⚠️ Could not calculate distance - Including flight search by default")
             else:
                 # Could not resolve airports, default to including flights
-                state["skip_flight_search"] = False
-                state["is_domestic_travel"] = False
-                print(f"⚠️ Could not resolve airports - Including flight search by default")
+                update["skip_flight_search"] = False
+                update["is_domestic_travel"] = False
+                logger.warning("⚠️ Could not resolve airports - Including flight search by default")
             
-            state["completed_agents"].append("travel_type_analyzer")
+            update["completed_agents"] = ["travel_type_analyzer"]
             
         except Exception as e:
             error_msg = f"Travel type analysis error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
             # Default to including flight search on error
-            state["skip_flight_search"] = False
-            state["is_domestic_travel"] = False
+            update["skip_flight_search"] = False
+            update["is_domestic_travel"] = False
         
-        return state
+        return update
+    
+    def _remember_travel_type(self, route_key: Tuple[str, str], update: Dict[str, Any]):
+        """Memoize a resolved travel-type decision for the route"""
+        self._travel_type_cache.set(
+            route_key,
+            (update["skip_flight_search"], update["is_domestic_travel"], update["travel_distance_km"])
+        )
+    
+    @staticmethod
+    async def _gather_lookups(*lookups) -> List[Any]:
+        """Run independent lookups concurrently, raising the first failure once all have settled"""
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
     
     def _route_after_emotional_intelligence(self, state: TravelState) -> str:
         """Determine routing after emotional intelligence based on travel type"""
         if state.get("skip_flight_search", False):
-            print("🔀 Routing: Skipping flight search → Going to hotel search")
+            logger.info("🔀 Routing: Skipping flight search → Going to hotel search")
             return "hotel_search"
         else:
-            print("🔀 Routing: Including flight search")
+            logger.info("🔀 Routing: Including flight search")
             return "flight_search"
     
-    async def _run_emotional_intelligence_agent(self, state: TravelState) -> TravelState:
+    def _route_after_search(self, state: TravelState) -> str:
+        """Skip the downstream agents when a trip that needs flights got no flight search result"""
+        if "flight_search" not in state["completed_agents"]:
+            logger.info("🔀 Routing: Flight search failed → Skipping transportation, costs and recommendations")
+            return "abort"
+        return "ok"
+    
+    async def _execute_agent(self, name: str, request: TravelRequest, context: Dict[str, Any] = None) -> AgentResponse:
+        """Run an agent once a slot for its type is free, recording how long the call queued"""
+        queued_at = time.monotonic()
+        async with self._agent_slots[name]:
+            self.agent_wait_seconds[name] += time.monotonic() - queued_at
+            return await self.agents[name].execute_with_timeout(request, context)
+    
+    async def _run_emotional_intelligence_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the emotional intelligence agent"""
-        print("🧠 Running Emotional Intelligence Agent...")
+        if "emotional_intelligence" in state["completed_agents"]:
+            return {}
+        
+        logger.info("🧠 Running Emotional Intelligence Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["emotional_intelligence"]
-            response = await agent.execute_with_timeout(state["request"])
+            response = await self._execute_agent("emotional_intelligence", state["request"])
             
             if response.success:
-                state["emotional_analysis"] = response.data
-                state["completed_agents"].append("emotional_intelligence")
-                print("✅ Emotional Intelligence Agent completed")
+                update["emotional_analysis"] = response.data
+                update["completed_agents"] = ["emotional_intelligence"]
+                logger.info("✅ Emotional Intelligence Agent completed")
             else:
-                state["errors"].append(f"Emotional Intelligence Agent failed: {response.error}")
-                print(f"❌ Emotional Intelligence Agent failed: {response.error}")
+                update["errors"] = [f"Emotional Intelligence Agent failed: {response.error}"]
+                logger.error("❌ Emotional Intelligence Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Emotional Intelligence Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
+        
+        return update
+    
+    async def _run_flight_and_hotel_parallel(self, state: TravelState) -> Dict[str, Any]:
+        """Run the flight and hotel search agents concurrently"""
+        logger.info("⚡ Running Flight and Hotel Search Agents in parallel...")
+        
+        flight_update, hotel_update = await asyncio.gather(
+            self._run_flight_search_agent(state),
+            self._run_hotel_search_agent(state)
+        )
+        
+        # The searches write disjoint keys; only the reducer lists need joining
+        update = {**flight_update, **hotel_update}
+        for key in ("completed_agents", "errors"):
+            combined = flight_update.get(key, []) + hotel_update.get(key, [])
+            if combined:
+                update[key] = combined
         
-        return state
+        return update
     
-    async def _run_flight_search_agent(self, state: TravelState) -> TravelState:
+    async def _run_flight_search_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the flight search agent"""
-        print("✈️ Running Flight Search Agent...")
+        if "flight_search" in state["completed_agents"]:
+            return {}
+        
+        logger.info("✈️ Running Flight Search Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["flight_search"]
             context = {
                 "emotional_intelligence": state["emotional_analysis"],
                 "include_price_trends": state["request"].include_price_trends
             }
-            response = await agent.execute_with_timeout(state["request"], context)
+            response = await self._execute_agent("flight_search", state["request"], context)
             
             if response.success:
                 flights_data = response.data.get("flights", [])
-                state["flights"] = [Flight(**flight) for flight in flights_data]
+                update["flights"] = [Flight(**flight) for flight in flights_data]
+                update["flights_serialized"] = [flight.model_dump() for flight in update["flights"]]
                 
                 # Store price trends if available
                 if "price_trends" in response.data:
-                    if "price_trends" not in state:
-                        state["price_trends"] = {}
-                    state["price_trends"] = response.data["price_trends"]
+                    update["price_trends"] = response.data["price_trends"]
                 
-                state["completed_agents"].append("flight_search")
-                print("✅ Flight Search Agent completed")
+                update["completed_agents"] = ["flight_search"]
+                logger.info("✅ Flight Search Agent completed")
             else:
-                state["errors"].append(f"Flight Search Agent failed: {response.error}")
-                print(f"❌ Flight Search Agent failed: {response.error}")
+                update["errors"] = [f"Flight Search Agent failed: {response.error}"]
+                logger.error("❌ Flight Search Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Flight Search Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
-    async def _run_hotel_search_agent(self, state: TravelState) -> TravelState:
+    async def _run_hotel_search_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the hotel search agent"""
-        print("🏨 Running Hotel Search Agent...")
+        if "hotel_search" in state["completed_agents"]:
+            return {}
+        
+        logger.info("🏨 Running Hotel Search Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["hotel_search"]
             context = {
-                "emotional_intelligence": state["emotional_analysis"],
-                "flight_search_agent": {"data": {"flights": [flight.dict() for flight in state["flights"]]}}
+                "emotional_intelligence": state["emotional_analysis"]
             }
-            response = await agent.execute_with_timeout(state["request"], context)
+            response = await self._execute_agent("hotel_search", state["request"], context)
             
             if response.success:
                 hotels_data = response.data.get("hotels", [])
-                state["hotels"] = [Hotel(**hotel) for hotel in hotels_data]
+                update["hotels"] = [Hotel(**hotel) for hotel in hotels_data]
+                update["hotels_serialized"] = [hotel.model_dump() for hotel in update["hotels"]]
                 
-                state["completed_agents"].append("hotel_search")
-                print("✅ Hotel Search Agent completed")
+                update["completed_agents"] = ["hotel_search"]
+                logger.info("✅ Hotel Search Agent completed")
             else:
-                state["errors"].append(f"Hotel Search Agent failed: {response.error}")
-                print(f"❌ Hotel Search Agent failed: {response.error}")
+                update["errors"] = [f"Hotel Search Agent failed: {response.error}"]
+                logger.error("❌ Hotel Search Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Hotel Search Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
-    async def _run_transportation_agent(self, state: TravelState) -> TravelState:
+    async def _run_transportation_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the transportation agent"""
-        print("🚗 Running Transportation Agent...")
+        logger.info("🚗 Running Transportation Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["transportation"]
+            # Built once here and reused by the cost estimation and recommendation contexts
             context = {
                 "emotional_intelligence": state["emotional_analysis"],
-                "flight_search_agent": {"data": {"flights": [flight.dict() for flight in state["flights"]]}},
-                "hotel_search_agent": {"data": {"hotels": [hotel.dict() for hotel in state["hotels"]]}}
+                "flight_search_agent": {"data": {"flights": state["flights_serialized"]}},
+                "hotel_search_agent": {"data": {"hotels": state["hotels_serialized"]}}
             }
-            response = await agent.execute_with_timeout(state["request"], context)
+            update["search_context"] = context
+            response = await self._execute_agent("transportation", state["request"], context)
             
             if response.success:
-                state["transportation"] = response.data
-                state["completed_agents"].append("transportation")
-                print("✅ Transportation Agent completed")
+                update["transportation"] = response.data
+                update["completed_agents"] = ["transportation"]
+                logger.info("✅ Transportation Agent completed")
             else:
-                state["errors"].append(f"Transportation Agent failed: {response.error}")
-                print(f"❌ Transportation Agent failed: {response.error}")
+                update["errors"] = [f"Transportation Agent failed: {response.error}"]
+                logger.error("❌ Transportation Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Transportation Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
-    async def _run_cost_estimation_agent(self, state: TravelState) -> TravelState:
+    async def _run_cost_estimation_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the cost estimation agent"""
-        print("💰 Running Cost Estimation Agent...")
+        logger.info("💰 Running Cost Estimation Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["cost_estimation"]
             context = {
-                "emotional_intelligence": state["emotional_analysis"],
-                "flight_search_agent": {"data": {"flights": [flight.dict() for flight in state["flights"]]}},
-                "hotel_search_agent": {"data": {"hotels": [hotel.dict() for hotel in state["hotels"]]}},
+                **state["search_context"],
                 "transportation_agent": state["transportation"]
             }
-            response = await agent.execute_with_timeout(state["request"], context)
+            response = await self._execute_agent("cost_estimation", state["request"], context)
             
             if response.success:
                 cost_data = response.data.get("cost_breakdown", {})
-                state["cost_breakdown"] = CostBreakdown(**cost_data)
-                state["completed_agents"].append("cost_estimation")
-                print("✅ Cost Estimation Agent completed")
+                update["cost_breakdown"] = CostBreakdown(**cost_data)
+                update["completed_agents"] = ["cost_estimation"]
+                logger.info("✅ Cost Estimation Agent completed")
             else:
-                state["errors"].append(f"Cost Estimation Agent failed: {response.error}")
-                print(f"❌ Cost Estimation Agent failed: {response.error}")
+                update["errors"] = [f"Cost Estimation Agent failed: {response.error}"]
+                logger.error("❌ Cost Estimation Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Cost Estimation Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
-    async def _run_recommendation_agent(self, state: TravelState) -> TravelState:
+    async def _run_recommendation_agent(self, state: TravelState) -> Dict[str, Any]:
         """Run the recommendation agent"""
-        print("🎯 Running Recommendation Agent...")
+        logger.info("🎯 Running Recommendation Agent...")
+        
+        update: Dict[str, Any] = {}
         
         try:
-            agent = self.agents["recommendation"]
             context = {
-                "emotional_intelligence": state["emotional_analysis"],
-                "flight_search_agent": {"data": {"flights": [flight.dict() for flight in state["flights"]]}},
-                "hotel_search_agent": {"data": {"hotels": [hotel.dict() for hotel in state["hotels"]]}},
+                **state["search_context"],
                 "transportation_agent": state["transportation"],
                 "cost_estimation_agent": {"data": {"cost_breakdown": state["cost_breakdown"].dict()}}
             }
-            response = await agent.execute_with_timeout(state["request"], context)
+            response = await self._execute_agent("recommendation", state["request"], context)
             
             if response.success:
                 itinerary_data = response.data.get("itinerary", [])
-                state["itinerary"] = [DayItinerary(**day) for day in itinerary_data]
-                state["recommendations"] = response.data.get("recommendations", [])
-                state["completed_agents"].append("recommendation")
-                print("✅ Recommendation Agent completed")
+                update["itinerary"] = [DayItinerary(**day) for day in itinerary_data]
+                update["recommendations"] = response.data.get("recommendations", [])
+                update["completed_agents"] = ["recommendation"]
+                logger.info("✅ Recommendation Agent completed")
             else:
-                state["errors"].append(f"Recommendation Agent failed: {response.error}")
-                print(f"❌ Recommendation Agent failed: {response.error}")
+                update["errors"] = [f"Recommendation Agent failed: {response.error}"]
+                logger.error("❌ Recommendation Agent failed: %s", response.error)
             
         except Exception as e:
             error_msg = f"Recommendation Agent error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
-    async def _finalize_travel_plan(self, state: TravelState) -> TravelState:
+    async def _finalize_travel_plan(self, state: TravelState) -> Dict[str, Any]:
         """Finalize the travel plan and create season recommendation"""
-        print("🎉 Finalizing travel plan...")
+        logger.info("🎉 Finalizing travel plan...")
+        
+        update: Dict[str, Any] = {}
         
         try:
             # Create season recommendation
             current_season = self._get_season_from_date(state["request"].start_date)
-            optimal_seasons = self._get_optimal_seasons_for_vibe(state["request"].vibe)
-            is_optimal = current_season in optimal_seasons
-            
-            state["season_recommendation"] = SeasonRecommendation(
-                current_season=current_season,
-                optimal_season=optimal_seasons[0] if optimal_seasons else current_season,
-                is_optimal=is_optimal,
-                recommendation=self._get_season_recommendation_message(
-                    state["request"].vibe, current_season, optimal_seasons
-                ),
-                alternative_months=self._get_alternative_months(optimal_seasons),
-                weather_considerations=self._get_weather_considerations(current_season)
+            update["season_recommendation"] = SeasonRecommendation(
+                **self._season_recommendation(state["request"].vibe.value, current_season)
             )
             
-            print("✅ Travel plan finalized")
+            logger.info("✅ Travel plan finalized")
             
         except Exception as e:
             error_msg = f"Finalization error: {str(e)}"
-            state["errors"].append(error_msg)
-            print(f"❌ {error_msg}")
+            update["errors"] = [error_msg]
+            logger.error("❌ %s", error_msg)
         
-        return state
+        return update
     
     def _create_travel_response(self, state: TravelState) -> TravelResponse:
         """Create the final travel response"""
-        total_cost = sum([
-            state["cost_breakdown"].flights,
-            state["cost_breakdown"].accommodation,
-            state["cost_breakdown"].transportation,
-            state["cost_breakdown"].activities,
-            state["cost_breakdown"].food,
-            state["cost_breakdown"].miscellaneous
-        ])
-        
         # Enhance vibe_analysis with trip details
         enhanced_vibe_analysis = state["emotional_analysis"].copy() if state["emotional_analysis"] else {}
         enhanced_vibe_analysis.update({
@@ -520,12 +786,12 @@ class TravelOrchestrator:
         })
         
         return TravelResponse(
-            request_id=str(uuid.uuid4()),
+            request_id=_new_request_id(),
             flights=state["flights"],
             hotels=state["hotels"],
             itinerary=state["itinerary"],
             cost_breakdown=state["cost_breakdown"],
-            total_cost=total_cost,
+            total_cost=state["cost_breakdown"].total,
             season_recommendation=state["season_recommendation"],
             recommendations=state["recommendations"],
             vibe_analysis=enhanced_vibe_analysis,
@@ -539,87 +805,49 @@ class TravelOrchestrator:
     def _get_season_from_date(self, date_str: str) -> str:
         """Get season from date string"""
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            month = date_obj.month
-            
-            if month in [12, 1, 2]:
-                return "winter"
-            elif month in [3, 4, 5]:
-                return "spring"
-            elif month in [6, 7, 8]:
-                return "summer"
-            else:
-                return "autumn"
-        except:
+            return _SEASON_BY_MONTH[datetime.strptime(date_str, '%Y-%m-%d').month]
+        except (TypeError, ValueError):
             return "unknown"
     
-    def _get_optimal_seasons_for_vibe(self, vibe) -> List[str]:
+    def _get_optimal_seasons_for_vibe(self, vibe: str) -> Tuple[str, ...]:
         """Get optimal seasons for a vibe"""
-        optimal_seasons = {
-            "romantic": ["spring", "autumn"],
-            "adventure": ["summer", "autumn"],
-            "beach": ["summer"],
-            "nature": ["spring", "autumn"],
-            "cultural": ["autumn", "spring"],
-            "culinary": ["autumn", "spring"],
-            "wellness": ["winter", "spring"]
-        }
-        return optimal_seasons.get(vibe.value, ["spring", "summer", "autumn"])
+        return _OPTIMAL_SEASONS_BY_VIBE.get(vibe, _DEFAULT_OPTIMAL_SEASONS)
     
-    def _get_season_recommendation_message(self, vibe, current_season: str, optimal_seasons: List[str]) -> str:
+    def _get_season_recommendation_message(self, vibe: str, current_season: str, optimal_seasons: Tuple[str, ...]) -> str:
         """Get season recommendation message"""
-        if current_season in optimal_seasons:
-            return f"Perfect timing! {current_season.title()} is ideal for {vibe.value} experiences."
-        else:
-            return f"Consider visiting in {optimal_seasons[0]} for the best {vibe.value} experience, but {current_season} can still be enjoyable."
+        return _season_recommendation_message(vibe, current_season, optimal_seasons)
     
-    def _get_alternative_months(self, optimal_seasons: List[str]) -> List[int]:
+    def _get_alternative_months(self, optimal_seasons: Tuple[str, ...]) -> Tuple[int, ...]:
         """Get alternative months for optimal seasons"""
-        season_months = {
-            "winter": [12, 1, 2],
-            "spring": [3, 4, 5],
-            "summer": [6, 7, 8],
-            "autumn": [9, 10, 11]
-        }
-        
-        months = []
-        for season in optimal_seasons:
-            months.extend(season_months.get(season, []))
-        
-        return sorted(list(set(months)))
+        return _alternative_months(optimal_seasons)
     
-    def _get_weather_considerations(self, season: str) -> List[str]:
+    def _get_weather_considerations(self, season: str) -> Tuple[str, ...]:
         """Get weather considerations for season"""
-        considerations = {
-            "winter": ["Pack warm clothing", "Check for snow conditions", "Book indoor activities"],
-            "spring": ["Pack layers", "Expect occasional rain", "Enjoy blooming flowers"],
-            "summer": ["Stay hydrated", "Use sunscreen", "Book air-conditioned activities"],
-            "autumn": ["Pack warm layers", "Enjoy fall colors", "Check for seasonal closures"]
+        return _WEATHER_CONSIDERATIONS.get(season, _DEFAULT_WEATHER_CONSIDERATIONS)
+    
+    def _build_season_recommendation(self, vibe: str, current_season: str) -> Dict[str, Any]:
+        """Season recommendation fields for a vibe and the season of travel"""
+        optimal_seasons = self._get_optimal_seasons_for_vibe(vibe)
+        return {
+            "current_season": current_season,
+            "optimal_season": optimal_seasons[0] if optimal_seasons else current_season,
+            "is_optimal": current_season in optimal_seasons,
+            "recommendation": self._get_season_recommendation_message(vibe, current_season, optimal_seasons),
+            "alternative_months": self._get_alternative_months(optimal_seasons),
+            "weather_considerations": self._get_weather_considerations(current_season)
         }
-        return considerations.get(season, ["Check local weather forecast"])
+    
+    def _season_recommendation(self, vibe: str, current_season: str) -> Dict[str, Any]:
+        """Season recommendation from the table precomputed at initialize, built on the fly for unlisted vibes"""
+        cached = self._season_rec_cache.get((vibe, current_season))
+        if cached is None:
+            cached = self._build_season_recommendation(vibe, current_season)
+        return dict(cached)
     
     async def get_season_recommendation(self, vibe: str, destination: str, start_date: str) -> Dict[str, Any]:
         """Get season recommendation for a specific vibe and destination"""
         try:
-            current_season = self._get_season_from_date(start_date)
-            
-            # Create a mock vibe object
-            class MockVibe:
-                def __init__(self, value):
-                    self.value = value
-            
-            mock_vibe = MockVibe(vibe)
-            optimal_seasons = self._get_optimal_seasons_for_vibe(mock_vibe)
-            is_optimal = current_season in optimal_seasons
-            
-            return {
-                "current_season": current_season,
-                "optimal_season": optimal_seasons[0] if optimal_seasons else current_season,
-                "is_optimal": is_optimal,
-                "recommendation": self._get_season_recommendation_message(mock_vibe, current_season, optimal_seasons),
-                "alternative_months": self._get_alternative_months(optimal_seasons),
-                "weather_considerations": self._get_weather_considerations(current_season)
-            }
+            return self._season_recommendation(vibe, self._get_season_from_date(start_date))
             
         except Exception as e:
             return {
@@ -19,13 +19,14 @@ from services.config import Settings
 from services.auth_service import get_current_user, AuthService
 from schemas.user_schema import UserResponse
 from services.stripe_service import StripeService
+from utils.logging_config import configure_logging, shutdown_logging
 
 # Import routers
 from routes.auth_routes import router as auth_router
 from routes.subscription_routes import router as subscription_router
 from routes.chat_routes import router as chat_router
 from routes.trips_routes import router as trips_router
-from routes.suitability_routes import router as suitability_router
+from routes.suitability_routes import router as suitability_router, shutdown_services as shutdown_suitability_services
 from routes.pdf_routes import router as pdf_router
 
 
@@ -160,6 +161,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     global orchestrator
     # Startup
+    configure_logging()
     print("🚀 Starting Travel Cost Estimator API...")
     orchestrator = TravelOrchestrator(settings)
     await orchestrator.initialize()
@@ -180,6 +182,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("🛑 Shutting down Travel Cost Estimator API...")
+    if orchestrator:
+        await orchestrator.shutdown()
+    await shutdown_suitability_services()
+    shutdown_logging()
 
 # Create FastAPI app
 app = FastAPI(
@@ -214,7 +220,6 @@ async def stripe_root_webhook(request: Request):
     return await StripeService.handle_webhook(payload, sig_header)
 # Create logger
 logger = logging.getLogger("travel_api")
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 # User Management Endpoints
 @app.post("/auth/register", response_model=UserResponse)
@@ -2,6 +2,17 @@ from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 from enum import Enum
+from functools import lru_cache
+
+@lru_cache(maxsize=4096)
+def trip_duration_days(start_date: str, return_date: str) -> int:
+    """Days between two YYYY-MM-DD dates (0 if either can't be parsed), cached per date pair"""
+    try:
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(return_date, '%Y-%m-%d')
+        return (end - start).days
+    except ValueError:
+        return 0
 
 class VibeType(str, Enum):
     ROMANTIC = "romantic"
@@ -39,6 +50,11 @@ class TravelRequest(BaseModel):
             if return_date <= start_date:
                 raise ValueError('Return date must be after start date')
         return v
+    
+    @property
+    def trip_duration(self) -> int:
+        """Trip duration in days (parsed once per date pair and shared by all agents)"""
+        return trip_duration_days(self.start_date, self.return_date)
 
 class Flight(BaseModel):
     """Flight information model"""
@@ -99,6 +115,12 @@ class CostBreakdown(BaseModel):
     food: float = 0
     miscellaneous: float = 0
     currency: str = "USD"
+    
+    @property
+    def total(self) -> float:
+        """Sum of all cost categories"""
+        return (self.flights + self.accommodation + self.transportation
+                + self.activities + self.food + self.miscellaneous)
 
 class SeasonRecommendation(BaseModel):
     """Season recommendation model"""
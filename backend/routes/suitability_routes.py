@@ -36,6 +36,11 @@ async def initialize_services():
         # Initialize without SERP service (price data will be unavailable)
         suitability_scorer = SuitabilityScorer(None)
 
+async def shutdown_services():
+    """Close the SERP service's HTTP client on app shutdown"""
+    if serp_service is not None:
+        await serp_service.aclose()
+
 @router.get("/api/vibe-suitability")
 async def get_vibe_suitability(
     vibe: str = Query(..., description="Vibe type (romantic, adventure, beach, etc.)"),
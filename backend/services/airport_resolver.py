@@ -3,11 +3,17 @@ Smart Airport Code Resolver
 Automatically finds the nearest airport for any city
 """
 
+import asyncio
 import httpx
 from typing import Optional, Dict, Tuple
 import json
 import re
 
+from utils.caching import SingleFlight, TTLCache
+
+# Most recently used city resolutions kept per resolver
+LOOKUP_CACHE_SIZE = 5000
+
 class AirportResolver:
     """Intelligent airport code resolution using multiple strategies"""
     
@@ -104,8 +110,9 @@ class AirportResolver:
     
     def __init__(self, serp_api_key: Optional[str] = None):
         self.serp_api_key = serp_api_key
-        self._cache: Dict[str, str] = {}  # Cache resolved codes
-        self._country_cache: Dict[str, str] = {}  # Cache country resolutions
+        self._cache = TTLCache(LOOKUP_CACHE_SIZE)  # Cache resolved codes (LRU)
+        self._country_cache = TTLCache(LOOKUP_CACHE_SIZE)  # Cache country resolutions (LRU)
+        self._country_pending = SingleFlight()  # In-flight geocoding lookups
     
     async def get_airport_code(self, city: str, country: Optional[str] = None) -> str:
         """
@@ -122,28 +129,29 @@ class AirportResolver:
         city_key = city.strip().lower()
         
         # Check cache first
-        if city_key in self._cache:
-            print(f"✈️ Resolved '{city}' → {self._cache[city_key]} (from cache)")
-            return self._cache[city_key]
+        cached = self._cache.get(city_key)
+        if cached is not None:
+            print(f"✈️ Resolved '{city}' → {cached} (from cache)")
+            return cached
         
         # Strategy 1: Check if it's already an airport code
         if len(city.strip()) == 3 and city.strip().isalpha():
             code = self._normalize_airport_code(city.strip().upper())
-            self._cache[city_key] = code
+            self._cache.set(city_key, code)
             return code
         
         # Strategy 2: Check core city map (covers 90% of searches)
         if city_key in self.CORE_CITY_MAP:
             code = self.CORE_CITY_MAP[city_key]
             print(f"✈️ Resolved '{city}' → {code} (from core map)")
-            self._cache[city_key] = code
+            self._cache.set(city_key, code)
             return code
         
         # Strategy 3: Smart web search for "nearest airport"
         code = await self._search_nearest_airport(city, country)
         if code and code != "UNKNOWN":
             print(f"✈️ Resolved '{city}' → {code} (from smart search)")
-            self._cache[city_key] = code
+            self._cache.set(city_key, code)
             return code
         
         # Strategy 4: Country fallback
@@ -152,14 +160,14 @@ class AirportResolver:
             if country_key in self.COUNTRY_AIRPORTS:
                 code = self.COUNTRY_AIRPORTS[country_key]
                 print(f"✈️ Resolved '{city}' → {code} (from country '{country}')")
-                self._cache[city_key] = code
+                self._cache.set(city_key, code)
                 return code
         
         # Strategy 5: Detect country from city and use country airport
         code = await self._detect_country_and_resolve(city)
         if code and code != "UNKNOWN":
             print(f"✈️ Resolved '{city}' → {code} (from detected country)")
-            self._cache[city_key] = code
+            self._cache.set(city_key, code)
             return code
         
         print(f"⚠️ WARNING: Could not find airport for '{city}' - returning UNKNOWN")
@@ -294,19 +302,20 @@ class AirportResolver:
         city_key = city.strip().lower()
         
         # Check cache first
-        if city_key in self._country_cache:
-            return self._country_cache[city_key]
+        cached = self._country_cache.get(city_key)
+        if cached is not None:
+            return cached
         
         # Check static mapping
         if city_key in self.CITY_TO_COUNTRY:
             country = self.CITY_TO_COUNTRY[city_key]
-            self._country_cache[city_key] = country
+            self._country_cache.set(city_key, country)
             return country
         
-        # Try to detect using geocoding API
-        country = await self._detect_country_from_api(city)
+        # Try to detect using geocoding API; concurrent callers share one request
+        country = await self._country_pending.run(city_key, lambda: self._detect_country_from_api(city))
         if country:
-            self._country_cache[city_key] = country
+            self._country_cache.set(city_key, country)
             return country
         
         return None
@@ -3,10 +3,15 @@ Distance Calculator Service
 Calculate distances between cities using multiple strategies
 """
 
+import asyncio
 import httpx
 import math
 from typing import Optional, Tuple
 from services.config import Settings
+from utils.caching import TTLCache
+
+# Most recently used city-pair distances kept per calculator
+DISTANCE_CACHE_SIZE = 5000
 
 
 class DistanceCalculator:
@@ -15,7 +20,7 @@ class DistanceCalculator:
     def __init__(self, settings: Settings = None, gmaps_client=None):
         self.settings = settings or Settings()
         self.gmaps_client = gmaps_client
-        self._distance_cache = {}
+        self._distance_cache = TTLCache(DISTANCE_CACHE_SIZE)
     
     async def calculate_distance(self, origin: str, destination: str) -> Optional[float]:
         """
@@ -29,22 +34,23 @@ class DistanceCalculator:
             Distance in kilometers, or None if calculation fails
         """
         # Check cache
-        cache_key = f"{origin.lower()}:{destination.lower()}"
-        if cache_key in self._distance_cache:
-            return self._distance_cache[cache_key]
+        cache_key = (origin.strip().lower(), destination.strip().lower())
+        cached = self._distance_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Try Google Maps API first (most accurate)
         if self.gmaps_client:
             distance = await self._calculate_with_gmaps(origin, destination)
             if distance:
-                self._distance_cache[cache_key] = distance
+                self._distance_cache.set(cache_key, distance)
                 print(f"📏 Distance {origin} → {destination}: {distance:.1f} km (Google Maps)")
                 return distance
         
         # Fallback to geocoding + haversine formula
         distance = await self._calculate_with_geocoding(origin, destination)
         if distance:
-            self._distance_cache[cache_key] = distance
+            self._distance_cache.set(cache_key, distance)
             print(f"📏 Distance {origin} → {destination}: {distance:.1f} km (Geocoding)")
             return distance
         
@@ -54,7 +60,9 @@ class DistanceCalculator:
     async def _calculate_with_gmaps(self, origin: str, destination: str) -> Optional[float]:
         """Calculate distance using Google Maps Distance Matrix API"""
         try:
-            result = self.gmaps_client.distance_matrix(
+            # googlemaps is a blocking requests-based client; keep it off the event loop
+            result = await asyncio.to_thread(
+                self.gmaps_client.distance_matrix,
                 origins=[origin],
                 destinations=[destination],
                 mode="driving",
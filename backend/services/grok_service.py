@@ -1,9 +1,20 @@
 import asyncio
 import httpx
-from typing import Dict, Any, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, Any, Optional
 import json
 
 from .config import Settings
+from utils.caching import SingleFlight
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json produces equivalent payloads
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
 class GrokService:
     """Service for interacting with Grok API"""
@@ -16,6 +27,11 @@ class GrokService:
         self.temperature = settings.grok_temperature
         self.max_tokens = settings.grok_max_tokens
         self.initialized = False
+        self._client: Optional[httpx.AsyncClient] = None
+        # Cleared when the model rejects json_schema response formats; plain JSON mode is used instead
+        self._json_schema_supported = True
+        # Completions in flight, keyed by the full request, so identical concurrent prompts share one call
+        self._inflight = SingleFlight()
     
     async def initialize(self):
         if not self.api_key:
@@ -25,55 +41,147 @@ class GrokService:
         
         self.initialized = True
     
-    async def generate_response(self, prompt: str, system_message: Optional[str] = None, force_json: bool = False) -> str:
+    def _get_client(self) -> httpx.AsyncClient:
+        """Persistent HTTP/2 client, so consecutive and concurrent calls reuse pooled connections"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.settings.api_timeout,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the persistent HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _build_payload(self, prompt: str, system_message: Optional[str], force_json: bool,
+                       json_schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        messages = []
+        # When forcing JSON, add system message that mentions "json"
+        if force_json and not system_message:
+            system_message = "You are a helpful assistant that responds in valid JSON format."
+        elif force_json and system_message and "json" not in system_message.lower():
+            system_message += " Always respond in valid JSON format."
+        
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+        
+        # Structured output when a schema is given ({"name": ..., "schema": {...}}); strict unless the
+        # caller says otherwise, so the API enforces the schema. Plain JSON mode if force_json is True
+        if json_schema is not None and self._json_schema_supported:
+            payload["response_format"] = {"type": "json_schema", "json_schema": {"strict": True, **json_schema}}
+        elif force_json:
+            payload["response_format"] = {"type": "json_object"}
+        return payload
+    
+    def _rejected_json_schema(self, payload: Dict[str, Any], response: httpx.Response) -> bool:
+        """Whether the API refused the payload's json_schema response format"""
+        if (response.status_code == 400 and payload.get("response_format", {}).get("type") == "json_schema"
+                and "json_schema" in response.text):
+            print(f"Grok model {self.model} does not support json_schema output, using JSON mode")
+            self._json_schema_supported = False
+            return True
+        return False
+    
+    async def generate_response(self, prompt: str, system_message: Optional[str] = None, force_json: bool = False,
+                                json_schema: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Return the completion for a prompt. Concurrent calls with an identical
+        prompt, system message and response format share a single API request.
+        """
         if not self.api_key:
             return self._get_mock_response(prompt)
         
+        schema_key = json.dumps(json_schema, sort_keys=True) if json_schema is not None else None
+        key = (prompt, system_message, force_json, schema_key)
+        return await self._inflight.run(
+            key, lambda: self._request_completion(prompt, system_message, force_json, json_schema)
+        )
+    
+    async def _request_completion(self, prompt: str, system_message: Optional[str], force_json: bool,
+                                  json_schema: Optional[Dict[str, Any]]) -> str:
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            messages = []
-            # When forcing JSON, add system message that mentions "json"
-            if force_json and not system_message:
-                system_message = "You are a helpful assistant that responds in valid JSON format."
-            elif force_json and system_message and "json" not in system_message.lower():
-                system_message += " Always respond in valid JSON format."
+            headers = self._headers()
+            payload = self._build_payload(prompt, system_message, force_json, json_schema)
             
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-            messages.append({"role": "user", "content": prompt})
+            response = await self._get_client().post(
+                self.base_url,
+                headers=headers,
+                content=_json_dumps(payload)
+            )
             
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": self.temperature,
-                "max_tokens": self.max_tokens,
-            }
-            
-            # Only add response_format if force_json is True and "json" is in messages
-            if force_json:
-                payload["response_format"] = {"type": "json_object"}
-            
-            async with httpx.AsyncClient(timeout=self.settings.api_timeout) as client:
-                response = await client.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"]
-                else:
-                    print(f"Grok API error: {response.status_code} - {response.text}")
-                    return self._get_mock_response(prompt)
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                return data["choices"][0]["message"]["content"]
+            elif self._rejected_json_schema(payload, response):
+                return await self._request_completion(prompt, system_message, force_json, None)
+            else:
+                print(f"Grok API error: {response.status_code} - {response.text}")
+                return self._get_mock_response(prompt)
                     
         except Exception as e:
             print(f"Error calling Grok API: {e}")
             return self._get_mock_response(prompt)
+    
+    async def stream_response(self, prompt: str, system_message: Optional[str] = None, force_json: bool = False,
+                              json_schema: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Yield the completion text in chunks as Grok generates it. Callers may stop
+        iterating early, which closes the connection. Falls back to the mock response
+        like generate_response when the API is unavailable.
+        """
+        if not self.api_key:
+            yield self._get_mock_response(prompt)
+            return
+        
+        payload = self._build_payload(prompt, system_message, force_json, json_schema)
+        payload["stream"] = True
+        received = schema_rejected = False
+        try:
+            async with self._get_client().stream("POST", self.base_url, headers=self._headers(), content=_json_dumps(payload)) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    schema_rejected = self._rejected_json_schema(payload, response)
+                    if not schema_rejected:
+                        print(f"Grok API error: {response.status_code} - {response.text}")
+                else:
+                    # Server-sent events: one "data: {json}" line per delta, ending with "data: [DONE]"
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        content = _json_loads(data)["choices"][0].get("delta", {}).get("content")
+                        if content:
+                            received = True
+                            yield content
+        except Exception as e:
+            print(f"Error streaming from Grok API: {e}")
+        
+        if schema_rejected:
+            async with aclosing(self.stream_response(prompt, system_message, force_json)) as retry:
+                async for chunk in retry:
+                    yield chunk
+        elif not received:
+            yield self._get_mock_response(prompt)
 
 
     def _get_mock_response(self, prompt: str) -> str:
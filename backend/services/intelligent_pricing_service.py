@@ -9,6 +9,8 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import json
 
+from utils.caching import SingleFlight
+
 
 class IntelligentPricingService:
     """
@@ -20,6 +22,7 @@ class IntelligentPricingService:
         self.grok_service = grok_service
         self._cache = {}
         self._cache_duration = 7 * 24 * 60 * 60  # 7 days cache
+        self._pending = SingleFlight()  # In-flight lookups, shared by concurrent callers
         
         # Base multiplier for USA (reference country)
         self.base_country = "United States"
@@ -46,6 +49,11 @@ class IntelligentPricingService:
         if country.lower() in ["usa", "united states", "united states of America"]:
             return 1.0
         
+        # Concurrent requests for the same country share one lookup
+        return await self._pending.run(cache_key, lambda: self._lookup_multiplier(country, cache_key))
+    
+    async def _lookup_multiplier(self, country: str, cache_key: str) -> float:
+        """Compute and cache the multiplier for a country that missed the cache"""
         # Get economic data
         economic_data = await self._get_country_economic_data(country)
         
@@ -9,8 +9,11 @@ from .airport_resolver import AirportResolver
 class SerpService:
     """Service for interacting with SERP API for flight and hotel data"""
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, http_client: Optional[httpx.AsyncClient] = None):
         self.settings = settings
+        # A client passed in is shared with other services and closed by its owner
+        self._client = http_client
+        self._owns_client = http_client is None
         self.api_key = settings.serp_api_key
         self.base_url = settings.serp_base_url or "https://serpapi.com/search"
         self.engine = settings.serp_engine
@@ -27,6 +30,18 @@ class SerpService:
         
         self.initialized = True
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Persistent HTTP client, so consecutive searches reuse pooled connections"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.settings.api_timeout)
+        return self._client
+    
+    async def aclose(self):
+        """Close the HTTP client if this service created it"""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def web_search(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Perform web search using SERP API"""
         if not self.api_key:
@@ -41,15 +56,15 @@ class SerpService:
             "num": num_results,
         }
         
-        async with httpx.AsyncClient(timeout=self.settings.api_timeout) as client:
-            response = await client.get(self.base_url, params=params)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"SERP web search error: {response.status_code} - {response.text}")
-                return {"organic_results": []}
-    
+        client = self._get_client()
+        response = await client.get(self.base_url, params=params)
+        
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"SERP web search error: {response.status_code} - {response.text}")
+            return {"organic_results": []}
+
     async def get_airport_code(self, city: str, country: Optional[str] = None) -> str:
         """
         Get IATA airport code for city using intelligent resolution
@@ -82,40 +97,40 @@ class SerpService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.settings.api_timeout) as client:
-                response = await client.get(self.base_url + ".json", params=params)
-                if response.status_code == 200:
-                    data = response.json()
-                    # If SERP puts results under "search_results" with an inner object, merge it for processing
-                    if isinstance(data.get("search_results"), dict):
-                        for k, v in data["search_results"].items():
-                            if k not in data:
-                                data[k] = v
-                    processed = self._process_flight_results(data)
-                    flights = processed.get("flights", [])
-                    
-                    if flights:
-                        print(f"✅ Found {len(flights)} real flights from SERP API")
-                    else:
-                        print(f"⚠️ No flights found in SERP response - using fallback data")
-                        # Fallback: if SERP returns nothing, provide a synthetic option so UI isn't empty
-                        flights = [{
-                            "airline": "SampleAir",
-                            "flight_number": "SA1001",
-                            "departure_time": f"{departure_date} 08:00",
-                            "arrival_time": f"{departure_date} 22:00",
-                            "departure_airport": origin,
-                            "arrival_airport": destination,
-                            "duration": "840 min",
-                            "class_type": "Economy",
-                            "price": 650.0,
-                            "stops": 1,
-                            "aircraft": "A330"
-                        }]
-                    return flights
+            client = self._get_client()
+            response = await client.get(self.base_url + ".json", params=params)
+            if response.status_code == 200:
+                data = response.json()
+                # If SERP puts results under "search_results" with an inner object, merge it for processing
+                if isinstance(data.get("search_results"), dict):
+                    for k, v in data["search_results"].items():
+                        if k not in data:
+                            data[k] = v
+                processed = self._process_flight_results(data)
+                flights = processed.get("flights", [])
+                
+                if flights:
+                    print(f"✅ Found {len(flights)} real flights from SERP API")
                 else:
-                    print(f"SERP Flights error: {response.status_code} - {response.text}")
-                    return []
+                    print(f"⚠️ No flights found in SERP response - using fallback data")
+                    # Fallback: if SERP returns nothing, provide a synthetic option so UI isn't empty
+                    flights = [{
+                        "airline": "SampleAir",
+                        "flight_number": "SA1001",
+                        "departure_time": f"{departure_date} 08:00",
+                        "arrival_time": f"{departure_date} 22:00",
+                        "departure_airport": origin,
+                        "arrival_airport": destination,
+                        "duration": "840 min",
+                        "class_type": "Economy",
+                        "price": 650.0,
+                        "stops": 1,
+                        "aircraft": "A330"
+                    }]
+                return flights
+            else:
+                print(f"SERP Flights error: {response.status_code} - {response.text}")
+                return []
         except Exception as e:
             print(f"Error calling SERP flights: {e}")
             return []
@@ -137,32 +152,32 @@ class SerpService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.settings.api_timeout) as client:
-                response = await client.get(self.base_url + ".json", params=params)
-                if response.status_code == 200:
-                    data = response.json()
-                    # Debug: Show structure of first hotel to understand SERP format
-                    properties = data.get("properties", [])
-                    if properties and len(properties) > 0:
-                        print("\n🔍 DEBUG: First hotel structure from SERP API:")
-                        first_hotel = properties[0]
-                        print(f"   Name: {first_hotel.get('name', 'N/A')}")
-                        print(f"   Available fields: {list(first_hotel.keys())}")
-                        
-                        # Show all price-related fields
-                        price_fields = ['rate_per_night', 'price', 'extracted_price', 'total_rate', 'nightly_rate', 'check_in_check_out']
-                        print(f"   Price-related fields:")
-                        for field in price_fields:
-                            value = first_hotel.get(field)
-                            if value is not None:
-                                print(f"     • {field}: {value} (type: {type(value).__name__})")
-                        print()
+            client = self._get_client()
+            response = await client.get(self.base_url + ".json", params=params)
+            if response.status_code == 200:
+                data = response.json()
+                # Debug: Show structure of first hotel to understand SERP format
+                properties = data.get("properties", [])
+                if properties and len(properties) > 0:
+                    print("\n🔍 DEBUG: First hotel structure from SERP API:")
+                    first_hotel = properties[0]
+                    print(f"   Name: {first_hotel.get('name', 'N/A')}")
+                    print(f"   Available fields: {list(first_hotel.keys())}")
                     
-                    processed = self._process_hotel_results(data)
-                    return processed.get("hotels", [])
-                else:
-                    print(f"SERP Hotels error: {response.status_code} - {response.text}")
-                    return []
+                    # Show all price-related fields
+                    price_fields = ['rate_per_night', 'price', 'extracted_price', 'total_rate', 'nightly_rate', 'check_in_check_out']
+                    print(f"   Price-related fields:")
+                    for field in price_fields:
+                        value = first_hotel.get(field)
+                        if value is not None:
+                            print(f"     • {field}: {value} (type: {type(value).__name__})")
+                    print()
+                
+                processed = self._process_hotel_results(data)
+                return processed.get("hotels", [])
+            else:
+                print(f"SERP Hotels error: {response.status_code} - {response.text}")
+                return []
         except Exception as e:
             print(f"Error calling SERP hotels: {e}")
             return []
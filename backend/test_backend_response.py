@@ -6,6 +6,7 @@ import asyncio
 from datetime import datetime
 
 from agents.travel_orchestrator import TravelOrchestrator
+from utils.logging_config import configure_logging
 from models.travel_models import TravelRequest, VibeType
 from services.config import Settings
 
@@ -57,7 +58,7 @@ async def test_galle_matara():
         print("-"*70)
         
         # Inter-city options
-        inter_city = response.transportation.get("inter_city_transportation", [])
+        inter_city = response.transportation.get("inter_city_options", [])
         print(f"\nInter-City Options: {len(inter_city)}")
         for i, option in enumerate(inter_city[:4], 1):
             cost = option.get('cost', option.get('cost_per_trip', 0))
@@ -74,7 +75,7 @@ async def test_galle_matara():
             print(f"  Options: {local.get('options', [])}")
         
         # Cost breakdown
-        costs = response.transportation.get("costs", {})
+        costs = response.transportation.get("cost_breakdown", {})
         if costs:
             print(f"\n💰 COST BREAKDOWN:")
             print(f"  Inter-City: ${costs.get('inter_city_transportation', 0):.2f}")
@@ -107,14 +108,14 @@ async def test_galle_matara():
     
     # Check inter-city cost
     if response.transportation:
-        inter_city_cost = response.transportation.get("costs", {}).get("inter_city_transportation", 0)
+        inter_city_cost = response.transportation.get("cost_breakdown", {}).get("inter_city_transportation", 0)
         if inter_city_cost > 10:
             issues.append(f"❌ Inter-city cost ${inter_city_cost:.2f} seems high (should be ~$2.58)")
         else:
             print(f"✓ Inter-city cost: ${inter_city_cost:.2f}")
         
         # Check local cost
-        local_cost = response.transportation.get("costs", {}).get("local_transportation", 0)
+        local_cost = response.transportation.get("cost_breakdown", {}).get("local_transportation", 0)
         if local_cost > 50:
             issues.append(f"⚠️ Local cost ${local_cost:.2f} seems high (should be ~$30-40)")
         else:
@@ -129,5 +130,6 @@ async def test_galle_matara():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_galle_matara())
 
@@ -9,6 +9,7 @@ from services.config import Settings
 from services.domestic_travel_analyzer import DynamicTransportationAnalyzer, TransportationStrategyCache
 from services.distance_calculator import DistanceCalculator
 from services.airport_resolver import AirportResolver
+from utils.logging_config import configure_logging
 
 
 async def test_same_airport_domestic():
@@ -278,5 +279,6 @@ async def run_all_tests():
 
 if __name__ == "__main__":
     # Run the test suite
+    configure_logging()
     asyncio.run(run_all_tests())
 
@@ -0,0 +1,30 @@
+"""
+Test LLM duration parsing in the transportation agent
+"""
+
+from agents.transportation_agent import TransportationAgent
+from services.config import Settings
+
+
+agent = TransportationAgent(Settings())
+
+
+def test_hours_and_minutes():
+    assert agent._parse_duration("1h 30m") == 1.5
+
+
+def test_minutes_only():
+    assert agent._parse_duration("45m") == 0.8
+
+
+def test_text_without_duration_falls_back_to_one_hour():
+    assert agent._parse_duration("flexible") == 1.0
+
+
+def test_range_falls_back_to_one_hour():
+    assert agent._parse_duration("2-3 hours") == 1.0
+
+
+def test_leading_words_are_skipped():
+    assert agent._parse_duration("about 2 hours") == 2.0
+    assert agent._parse_duration("approx. 3h") == 3.0
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from models.travel_models import TravelRequest, VibeType
 from agents.travel_orchestrator import TravelOrchestrator
 from services.config import Settings
+from utils.logging_config import configure_logging
 
 
 def print_section(title):
@@ -147,5 +148,6 @@ async def test_full_breakdown():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_full_breakdown())
 
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from agents.travel_orchestrator import TravelOrchestrator
 from models.travel_models import TravelRequest, VibeType
 from services.config import Settings
+from utils.logging_config import configure_logging
 
 
 async def test_full_travel_flow():
@@ -207,5 +208,6 @@ async def test_full_travel_flow():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_full_travel_flow())
 
@@ -10,6 +10,7 @@ from datetime import datetime
 from services.config import Settings
 from services.grok_service import GrokService
 from agents.transportation_pricing_agent import TransportationPricingAgent
+from utils.logging_config import configure_logging
 
 
 async def test_galle_matara_pricing():
@@ -151,5 +152,6 @@ async def test_galle_matara_pricing():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_galle_matara_pricing())
 
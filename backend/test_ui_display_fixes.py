@@ -15,6 +15,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from agents.travel_orchestrator import TravelOrchestrator
 from models.travel_models import TravelRequest, VibeType
 from services.config import Settings
+from utils.logging_config import configure_logging
 
 def print_section(title: str):
     """Print a formatted section header"""
@@ -59,7 +60,7 @@ async def test_galle_to_matara():
     # ================================================================
     print_section("TEST 1: DURATION DISPLAY FORMAT")
     
-    inter_city_options = response.transportation.get("inter_city_transportation", [])
+    inter_city_options = response.transportation.get("inter_city_options", [])
     
     print(f"Found {len(inter_city_options)} transportation options:\n")
     
@@ -161,5 +162,6 @@ async def test_galle_to_matara():
     print()
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(test_galle_to_matara())
 